@@ -6,17 +6,23 @@ Usage:
     python tools/generate-pages.py           # Generate all languages
     python tools/generate-pages.py es        # Generate Spanish only
     python tools/generate-pages.py es zh ko   # Generate specific languages
+    python tools/generate-pages.py --changed  # Skip pages that are up to date
+    python tools/generate-pages.py --debug    # Report dropped overlapping edits
 
 For each target language, creates /{lang}/ directory with translated HTML pages.
+With --changed, pages newer than their template, translation file and this
+script are skipped. With --debug, every edit dropped because it overlaps an
+earlier one is printed to stderr.
 Static HTML text is replaced via data-i18n attributes. JS translations are
 injected as an inline <script> setting window._T before i18n.js loads.
 """
 
+import bisect
+import functools
 import json
 import os
 import re
 import sys
-from html.parser import HTMLParser
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TRANSLATIONS_DIR = os.path.join(PROJECT_ROOT, "translations")
@@ -49,291 +55,569 @@ ASSET_PREFIXES = [
 # compare.html from /es/ correctly resolves to /es/compare.html)
 PAGE_LINKS = []
 
+# Set by --debug: report edits PageRewriter drops because they overlap
+DEBUG_EDITS = False
+
+# Translation sections needed at runtime by the page scripts (window._T)
+RUNTIME_KEYS = ["common", "js", "compare", "coverage", "card"]
+
+# Compiled patterns, shared across every page and language
+# Opening <html> tag shared by every English template (checked in main)
+HTML_LANG_TAG = '<html lang="en"'
+TAGLINE_RE = re.compile(r'(<p class="tagline">)[^<]+(</p>)')
+
+# Tool navigation links: English link text -> translation key.
+# Each label is matched after both NAV_LINK_OPENERS (active and non-active).
+NAV_MAP = {
+    "Line guide": "common.nav_line_guide",
+    "Commute comparison": "common.nav_commute_comparison",
+    "News coverage": "common.nav_news_coverage",
+    "Map": "common.nav_map",
+    "Embed &amp; share": "common.nav_embed",
+    "Blog": "common.nav_blog",
+    "About": "common.nav_about",
+}
+# Opening markup of the two tool-nav link variants used by the templates
+NAV_LINK_OPENERS = (
+    'class="tool-nav-link">',
+    'class="tool-nav-link active" aria-current="page">',
+)
+JSONLD_OPEN = '<script type="application/ld+json">'
+JSONLD_CLOSE = '</script>'
+
+# English transfer-card steps and tips on index.html, keyed by translation key.
+# Stored as they appear in the template (path_step5 already uses &rarr;).
+ENG_STEPS = {
+    "index.path_step1": "Exit your train and walk toward the main terminal building",
+    "index.path_step2": "Enter the historic waiting room / main concourse",
+    "index.path_step3": 'Look for PATH signs — the entrance is <strong>downstairs</strong>',
+    "index.path_step4": "Take escalator/stairs down to PATH platform level",
+    "index.path_step5": "Board the Hoboken &rarr; 33rd Street train",
+    "index.ferry_step1": "Exit your train and walk through the terminal building",
+    "index.ferry_step2": 'Exit on the <strong>waterfront side</strong> (east side, toward the river)',
+    "index.ferry_step3": "The ferry dock is along the waterfront walkway to the right",
+    "index.ferry_step4": "Look for NY Waterway signage and the boarding area",
+    "index.ferry_step5": "Board the ferry to W. 39th St, Midtown",
+    "index.bus_step1": "Exit your train and walk through the terminal building",
+    "index.bus_step2": 'Exit on the <strong>street side</strong> (west side, away from the river)',
+    "index.bus_step3": 'The bus stops are on <strong>Hudson Place</strong>, the street in front of the terminal',
+    "index.bus_step4": "Look for Bus 126 signage or ask NJ Transit staff",
+    "index.bus_step5": "Board Bus 126 to Port Authority Bus Terminal",
+}
+ENG_TIPS = {
+    "index.path_tip": "NJ Transit staff will be deployed throughout the terminal. Follow the crowds — most people will be heading to PATH.",
+    "index.ferry_tip": "Check the NY Waterway app for next departure time before leaving the terminal. Ferries run less frequently than PATH.",
+    "index.bus_tip": "Bus 126 goes through the Lincoln Tunnel. During peak hours, allow extra time for tunnel traffic.",
+}
+
+
+# Parsed translation files, keyed by language code
+TRANSLATION_CACHE = {}
+
 
 def load_translations(lang):
-    path = os.path.join(TRANSLATIONS_DIR, f"{lang}.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load translations/{lang}.json, parsing each file once per run."""
+    if lang not in TRANSLATION_CACHE:
+        path = os.path.join(TRANSLATIONS_DIR, f"{lang}.json")
+        with open(path, "r", encoding="utf-8") as f:
+            TRANSLATION_CACHE[lang] = json.load(f)
+    return TRANSLATION_CACHE[lang]
+
+
+# English template sources, keyed by page filename
+TEMPLATE_CACHE = {}
+
+
+def load_template(page_name):
+    """Read an English template, hitting the disk once per page per run."""
+    if page_name not in TEMPLATE_CACHE:
+        src_path = os.path.join(PROJECT_ROOT, page_name)
+        with open(src_path, "r", encoding="utf-8") as f:
+            TEMPLATE_CACHE[page_name] = f.read()
+    return TEMPLATE_CACHE[page_name]
+
+
+@functools.lru_cache(maxsize=None)
+def page_key_for(page_name):
+    """Translation key prefix for a page, e.g. "about.html" -> "about"."""
+    return PAGE_KEY_MAP.get(page_name, page_name.replace(".html", ""))
+
+
+def per_translations(build):
+    """Memoize build(translations, *args) per translations dict.
+
+    Entries are keyed by id() of the dict that was passed in, so derived
+    values always match the caller's translations.
+    """
+    cache = {}
+
+    @functools.wraps(build)
+    def cached_build(translations, *args):
+        key = (id(translations),) + args
+        cached = cache.get(key)
+        if cached is None or cached[0] is not translations:
+            # Keep the dict alive alongside its result so the id() can't be reused
+            cached = (translations, build(translations, *args))
+            cache[key] = cached
+        return cached[1]
+
+    return cached_build
+
+
+@per_translations
+def flatten_translations(translations):
+    """Map every dot-notation key in a translations dict to its value.
+
+    Built once per dict, so each get_translation() is a single dict lookup
+    instead of a walk down the nested sections.
+    """
+    flat = {}
+    stack = [("", translations)]
+    while stack:
+        prefix, obj = stack.pop()
+        for name, value in obj.items():
+            key = prefix + name
+            flat[key] = value
+            if isinstance(value, dict):
+                stack.append((key + ".", value))
+    return flat
 
 
 def get_translation(translations, key):
     """Look up a dot-notation key in the translations dict."""
-    parts = key.split(".")
-    obj = translations
-    for part in parts:
-        if not isinstance(obj, dict) or part not in obj:
-            return None
-        obj = obj[part]
-    return obj
+    return flatten_translations(translations).get(key)
+
+
+def trie_pattern(literals):
+    """Build a regex source matching any of the literals, factored as a trie.
+
+    Shared prefixes are emitted once, e.g. ["Dark", "Data"] becomes
+    "Da(?:rk|ta)", so the engine compares each prefix once instead of once
+    per alternative. Matches are the same as the flat "a|b|c" alternation:
+    where one literal is a prefix of another, the one listed first wins.
+    """
+    prefix = os.path.commonprefix(literals)
+    if prefix:
+        rest = trie_pattern([literal[len(prefix):] for literal in literals])
+        return re.escape(prefix) + rest
+    branches = {}
+    ends = False
+    for literal in literals:
+        if not literal:
+            # Every later literal here extends this one and can never win
+            ends = True
+            break
+        branches.setdefault(literal[0], []).append(literal)
+    alternatives = [trie_pattern(group) for group in branches.values()]
+    if ends:
+        alternatives.append("")
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_alternation(literals):
+    """Compile a tuple of literal strings into a single alternation regex.
+
+    Earlier literals take priority when two could match at the same offset.
+    Cached so each page's English snippet set is compiled only once.
+    """
+    return re.compile(trie_pattern(list(literals)))
+
+
+class PageRewriter:
+    """Collect edits against an English template and render them in one join.
+
+    Each edit is a (start, end, replacement) span of the original template.
+    Replacers register edits instead of rebuilding the whole document, and
+    render() stitches the result together once.
+
+    The first registration wins: every span is matched against the English
+    template, and an edit that overlaps one registered earlier is dropped
+    (kept in self.dropped) instead of rewriting the earlier edit's output.
+    Register the more specific edit first when two replacers touch the
+    same text.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.edits = []
+        self.dropped = []
+
+    def __contains__(self, needle):
+        return needle in self.text
+
+    def replace(self, old, new, count=0):
+        """Replace occurrences of a literal string (all when count=0)."""
+        text = self.text
+        size = len(old)
+        found = 0
+        start = text.find(old)
+        while start != -1:
+            self.edits.append((start, start + size, new))
+            found += 1
+            if found == count:
+                break
+            start = text.find(old, start + size)
+
+    def replace_between(self, opener, closer, new):
+        """Replace each span from opener through the next closer.
+
+        The literal-search equivalent of a lazy DOTALL regex such as
+        '<p class="disclaimer">.*?</p>'. new may be a string or a callable
+        taking the text between opener and closer. Returns the number of
+        spans found.
+        """
+        text = self.text
+        found = 0
+        start = text.find(opener)
+        while start != -1:
+            inner = start + len(opener)
+            end = text.find(closer, inner)
+            if end == -1:
+                break
+            span = new(text[inner:end]) if callable(new) else new
+            end += len(closer)
+            self.edits.append((start, end, span))
+            found += 1
+            start = text.find(opener, end)
+        return found
+
+    def replace_bounded(self, opener, closer, new):
+        """Replace each opener + value + closer, where value can't hold closer[0].
+
+        The literal-search equivalent of a regex such as
+        '<meta name="description" content="[^"]*">'. A value whose first
+        closer[0] does not start closer, e.g. a tag ending in '" />', is
+        left alone instead of being matched through to a later closer.
+        Returns the number of spans replaced.
+        """
+        text = self.text
+        stop = closer[0]
+        found = 0
+        start = text.find(opener)
+        while start != -1:
+            inner = start + len(opener)
+            end = text.find(stop, inner)
+            if end == -1:
+                break
+            if text.startswith(closer, end):
+                end += len(closer)
+                self.edits.append((start, end, new))
+                found += 1
+            start = text.find(opener, end)
+        return found
+
+    def insert_before(self, anchor, new, count=0):
+        """Insert text in front of occurrences of anchor (all when count=0)."""
+        text = self.text
+        found = 0
+        start = text.find(anchor)
+        while start != -1:
+            self.edits.append((start, start, new))
+            found += 1
+            if found == count:
+                break
+            start = text.find(anchor, start + len(anchor))
+
+    def sub(self, pattern, repl, count=0):
+        """Replace matches of a compiled pattern, like pattern.sub().
+
+        repl may be a template string or a callable taking the match.
+        Returns the number of matches found.
+        """
+        found = 0
+        for m in pattern.finditer(self.text):
+            new = repl(m) if callable(repl) else m.expand(repl)
+            self.edits.append((m.start(), m.end(), new))
+            found += 1
+            if found == count:
+                break
+        return found
+
+    def render(self):
+        """Apply the queued edits and return the rewritten document."""
+        kept = []   # accepted (start, end, seq, new), sorted by position
+        ends = []   # end offsets of kept, same order (non-decreasing)
+        for seq, (start, end, new) in enumerate(self.edits):
+            # First kept edit ending after our start is the only one that
+            # can overlap us; zero-width inserts only clash strictly inside
+            i = bisect.bisect_right(ends, start)
+            if i < len(kept) and kept[i][0] < end:
+                self.dropped.append((start, end, new))
+                continue
+            edit = (start, end, seq, new)
+            j = bisect.bisect(kept, edit)
+            kept.insert(j, edit)
+            ends.insert(j, end)
+
+        text = self.text
+        parts = []
+        pos = 0
+        for start, end, _, new in kept:
+            parts.append(text[pos:start])
+            parts.append(new)
+            pos = end
+        parts.append(text[pos:])
+        return "".join(parts)
+
+
+def apply_replacements(page, replacements):
+    """Queue an {english: translated} table on the page in one scan."""
+    if not replacements:
+        return
+    pattern = compile_alternation(tuple(replacements))
+    page.sub(pattern, lambda m: replacements[m.group(0)])
+
+
+@functools.lru_cache(maxsize=None)
+def asset_path_map(depth):
+    """Map template asset prefixes to their output form for a page depth."""
+    if depth == 0:
+        # Root-level page: css/ → ../css/
+        return dict(ASSET_PREFIXES)
+    # Nested page: existing ../ paths need one more ../
+    existing = '../' * depth
+    target = '../' * (depth + 1)
+    return {
+        f'{attr}{existing}{d}': f'{attr}{target}{d}'
+        for d in ['css/', 'img/', 'js/', 'data/']
+        for attr in ['href="', 'src="']
+    }
 
 
-def fix_asset_paths(html, page_name):
+def fix_asset_paths(page, page_name):
     """Adjust relative paths for subdirectory deployment.
 
     For root-level pages (depth 0), assets go from css/ to ../css/.
     For nested pages like blog/slug.html (depth 1), assets already have
     ../ in the source template, so we adjust ../css/ to ../../css/.
+    All prefixes for the page's depth are rewritten in a single scan.
     """
-    depth = page_name.count('/')
-    if depth == 0:
-        # Root-level page: css/ → ../css/
-        for old, new in ASSET_PREFIXES:
-            html = html.replace(old, new)
-    else:
-        # Nested page: existing ../ paths need one more ../
-        existing = '../' * depth
-        target = '../' * (depth + 1)
-        for d in ['css/', 'img/', 'js/', 'data/']:
-            for attr in ['href="', 'src="']:
-                html = html.replace(f'{attr}{existing}{d}', f'{attr}{target}{d}')
-
-    return html
+    apply_replacements(page, asset_path_map(page_name.count('/')))
 
 
-def set_html_lang(html, lang, direction="ltr"):
+def set_html_lang(page, lang, direction="ltr"):
     """Set the lang and dir attributes on <html>."""
-    html = re.sub(r'<html\s+lang="[^"]*"', f'<html lang="{lang}"', html)
+    # One <html> tag per page, so stop after the first match
     if direction == "rtl":
-        html = re.sub(r'<html\s+lang="' + lang + '"',
-                       f'<html lang="{lang}" dir="rtl"', html)
-    return html
+        page.replace(HTML_LANG_TAG, f'<html lang="{lang}" dir="rtl"', count=1)
+    else:
+        page.replace(HTML_LANG_TAG, f'<html lang="{lang}"', count=1)
 
 
-def replace_title(html, translations, page_key):
+def replace_title(page, translations, page_key):
     """Replace <title> content."""
     title = get_translation(translations, f"{page_key}.title")
     if title:
-        html = re.sub(r'<title>[^<]+</title>', f'<title>{title}</title>', html)
-    return html
+        page.replace_bounded('<title>', '</title>', f'<title>{title}</title>')
 
 
-def replace_meta(html, translations, page_key):
+def replace_meta(page, translations, page_key):
     """Replace OG/Twitter meta content with translated values."""
     title = get_translation(translations, f"{page_key}.title")
     if title:
-        html = re.sub(
-            r'<meta property="og:title" content="[^"]*">',
-            f'<meta property="og:title" content="{title}">',
-            html
+        page.replace_bounded(
+            '<meta property="og:title" content="', '">',
+            f'<meta property="og:title" content="{title}">'
         )
-        html = re.sub(
-            r'<meta name="twitter:title" content="[^"]*">',
-            f'<meta name="twitter:title" content="{title}">',
-            html
+        page.replace_bounded(
+            '<meta name="twitter:title" content="', '">',
+            f'<meta name="twitter:title" content="{title}">'
         )
-    return html
 
 
-def replace_meta_description(html, translations, page_key):
+def replace_meta_description(page, translations, page_key):
     """Replace meta description and og:description with translated values."""
     desc = get_translation(translations, f"meta.{page_key}_description")
     og_desc = get_translation(translations, f"meta.{page_key}_og_description")
     if desc:
-        html = re.sub(
-            r'<meta name="description" content="[^"]*">',
-            f'<meta name="description" content="{desc}">',
-            html
+        page.replace_bounded(
+            '<meta name="description" content="', '">',
+            f'<meta name="description" content="{desc}">'
         )
     if og_desc:
-        html = re.sub(
-            r'<meta property="og:description" content="[^"]*">',
-            f'<meta property="og:description" content="{og_desc}">',
-            html
+        page.replace_bounded(
+            '<meta property="og:description" content="', '">',
+            f'<meta property="og:description" content="{og_desc}">'
         )
-        html = re.sub(
-            r'<meta name="twitter:description" content="[^"]*">',
-            f'<meta name="twitter:description" content="{og_desc}">',
-            html
+        page.replace_bounded(
+            '<meta name="twitter:description" content="', '">',
+            f'<meta name="twitter:description" content="{og_desc}">'
         )
-    return html
 
 
-def fix_og_url(html, lang, page_name):
+def fix_og_url(page, lang, page_name):
     """Fix og:url to point to the translated page's own URL."""
     translated_url = f"https://reroutenj.org/{lang}/{page_name}"
-    html = re.sub(
-        r'<meta property="og:url" content="[^"]*">',
-        f'<meta property="og:url" content="{translated_url}">',
-        html
+    page.replace_bounded(
+        '<meta property="og:url" content="', '">',
+        f'<meta property="og:url" content="{translated_url}">'
     )
-    return html
 
 
-def add_canonical(html, lang, page_name):
+def add_canonical(page, lang, page_name):
     """Replace or add canonical link pointing to this translated page's own URL."""
     canonical_url = f"https://reroutenj.org/{lang}/{page_name}"
-    if re.search(r'<link rel="canonical" href="[^"]*">', html):
-        html = re.sub(
-            r'<link rel="canonical" href="[^"]*">',
-            f'<link rel="canonical" href="{canonical_url}">',
-            html
-        )
-    else:
-        html = html.replace(
-            '<link rel="icon"',
-            f'<link rel="canonical" href="{canonical_url}">\n  <link rel="icon"'
-        )
-    return html
+    replaced = page.replace_bounded(
+        '<link rel="canonical" href="', '">',
+        f'<link rel="canonical" href="{canonical_url}">'
+    )
+    if not replaced:
+        page.insert_before('<link rel="icon"', f'<link rel="canonical" href="{canonical_url}">\n  ')
 
 
-def replace_tagline(html, translations, page_key):
+def replace_tagline(page, translations, page_key):
     """Replace the tagline text."""
+    if '<p class="tagline">' not in page:
+        return
     tagline = get_translation(translations, f"{page_key}.tagline")
     if tagline:
-        html = re.sub(
-            r'(<p class="tagline">)[^<]+(</p>)',
-            lambda m: m.group(1) + tagline + m.group(2),
-            html
-        )
-    return html
-
-
-def replace_nav_links(html, translations):
-    """Replace navigation link text."""
-    nav_map = {
-        "Line guide": "common.nav_line_guide",
-        "Commute comparison": "common.nav_commute_comparison",
-        "News coverage": "common.nav_news_coverage",
-        "Map": "common.nav_map",
-        "Embed &amp; share": "common.nav_embed",
-        "Blog": "common.nav_blog",
-        "About": "common.nav_about",
-    }
-    for eng_text, key in nav_map.items():
+        page.sub(TAGLINE_RE, lambda m: m.group(1) + tagline + m.group(2))
+
+
+@per_translations
+def nav_replacements(translations):
+    """Map each English nav link to its translated form (once per language).
+
+    Both link variants the templates use are spelled out as literals, so
+    the whole table is applied without a capture-group regex.
+    """
+    replacements = {}
+    for eng_text, key in NAV_MAP.items():
         translated = get_translation(translations, key)
         if translated:
             escaped = translated.replace("&", "&amp;")
-            # Handle both active and non-active nav links
-            # [^>]* after the closing " matches extra attrs like aria-current="page"
-            html = re.sub(
-                r'(class="tool-nav-link[^"]*"[^>]*>)' + re.escape(eng_text) + r'(</a>)',
-                lambda m: m.group(1) + escaped + m.group(2),
-                html
-            )
-    return html
+            for opener in NAV_LINK_OPENERS:
+                replacements[f'{opener}{eng_text}</a>'] = f'{opener}{escaped}</a>'
+    return replacements
+
 
+def replace_nav_links(page, translations):
+    """Replace navigation link text in a single scan of the page."""
+    if 'class="tool-nav-link' not in page:
+        return
+    apply_replacements(page, nav_replacements(translations))
 
-def replace_a11y_buttons(html, translations):
-    """Replace accessibility toggle button text."""
+
+@per_translations
+def chrome_replacements(translations):
+    """Build the skip link and a11y button table (once per language)."""
+    replacements = {}
+    text = get_translation(translations, "common.skip_to_main")
+    if text:
+        replacements['class="skip-link">Skip to main content</a>'] = (
+            f'class="skip-link">{text}</a>'
+        )
     hc = get_translation(translations, "common.high_contrast")
-    sv = get_translation(translations, "common.simplified_view")
     if hc:
-        html = html.replace(
-            'aria-label="Toggle high contrast">High contrast</button>',
+        replacements['aria-label="Toggle high contrast">High contrast</button>'] = (
             f'aria-label="Toggle high contrast">{hc}</button>'
         )
+    sv = get_translation(translations, "common.simplified_view")
     if sv:
-        html = html.replace(
-            'aria-label="Toggle simplified view">Simplified view</button>',
+        replacements['aria-label="Toggle simplified view">Simplified view</button>'] = (
             f'aria-label="Toggle simplified view">{sv}</button>'
         )
-    return html
-
-
-def replace_skip_link(html, translations):
-    """Replace skip link text."""
-    text = get_translation(translations, "common.skip_to_main")
-    if text:
-        html = html.replace(
-            'class="skip-link">Skip to main content</a>',
-            f'class="skip-link">{text}</a>'
-        )
-    return html
+    return replacements
+
+
+def replace_chrome(page, translations):
+    """Replace skip link and accessibility toggle button text."""
+    # A handful of long literals: str.find beats one regex scan here
+    for old, new in chrome_replacements(translations).items():
+        page.replace(old, new)
+
+
+# Footer disclaimer tail per page key; pages not listed use the index tail
+FOOTER_TAILS = {
+    "index": ' {idx} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {idx_after}',
+    "compare": ' {idx} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {idx_after}',
+    "coverage": ' {cov} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {cov_after}',
+    "map": ' {map_data} <a href="https://www.openstreetmap.org/copyright" target="_blank" rel="noopener">OpenStreetMap</a>. {map_tiles} <a href="https://carto.com/" target="_blank" rel="noopener">CARTO</a>.',
+    "embed": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "blog": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "blog_post": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "blog_post_embed": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "blog_post_cutover": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "blog_post_bridge": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+    "about": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
+}
 
 
-def replace_footer(html, translations, page_key):
-    """Replace footer text with full per-page translations."""
+@per_translations
+def footer_disclaimer(translations, page_key):
+    """Build the translated footer disclaimer paragraph (once per language and page)."""
     disclaimer = get_translation(translations, "common.footer_disclaimer")
-    built_by = get_translation(translations, "common.footer_built_by")
+    if not disclaimer:
+        return None
+
+    idx = get_translation(translations, "common.footer_disclaimer_index") or "Information is based on official announcements and may change. Always verify with"
+    idx_after = get_translation(translations, "common.footer_disclaimer_index_after") or "before traveling."
+    cov = get_translation(translations, "common.footer_disclaimer_coverage") or "News links go to their original sources. Always verify with"
+    cov_after = get_translation(translations, "common.footer_disclaimer_coverage_after") or "before traveling."
+    map_data = get_translation(translations, "common.footer_disclaimer_map") or "Map data &copy; contributors of"
+    map_tiles = get_translation(translations, "common.footer_disclaimer_map_tiles") or "Tiles &copy;"
+    embed_gh = get_translation(translations, "common.footer_disclaimer_embed") or "View source on GitHub"
+
+    tail_template = FOOTER_TAILS.get(page_key, FOOTER_TAILS["index"])
+    tail = tail_template.format(
+        idx=idx, idx_after=idx_after,
+        cov=cov, cov_after=cov_after,
+        map_data=map_data, map_tiles=map_tiles,
+        embed_gh=embed_gh,
+    )
+    return f'<p class="disclaimer"><strong>Reroute NJ</strong> {disclaimer}{tail}</p>'
 
-    # Build per-page footer disclaimer paragraph
-    if disclaimer:
-        # Construct the translated tail per page
-        tail_map = {
-            "index": ' {idx} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {idx_after}',
-            "compare": ' {idx} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {idx_after}',
-            "coverage": ' {cov} <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> {cov_after}',
-            "map": ' {map_data} <a href="https://www.openstreetmap.org/copyright" target="_blank" rel="noopener">OpenStreetMap</a>. {map_tiles} <a href="https://carto.com/" target="_blank" rel="noopener">CARTO</a>.',
-            "embed": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "blog": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "blog_post": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "blog_post_embed": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "blog_post_cutover": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "blog_post_bridge": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-            "about": ' <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">{embed_gh}</a>.',
-        }
-        idx = get_translation(translations, "common.footer_disclaimer_index") or "Information is based on official announcements and may change. Always verify with"
-        idx_after = get_translation(translations, "common.footer_disclaimer_index_after") or "before traveling."
-        cov = get_translation(translations, "common.footer_disclaimer_coverage") or "News links go to their original sources. Always verify with"
-        cov_after = get_translation(translations, "common.footer_disclaimer_coverage_after") or "before traveling."
-        map_data = get_translation(translations, "common.footer_disclaimer_map") or "Map data &copy; contributors of"
-        map_tiles = get_translation(translations, "common.footer_disclaimer_map_tiles") or "Tiles &copy;"
-        embed_gh = get_translation(translations, "common.footer_disclaimer_embed") or "View source on GitHub"
-
-        tail_template = tail_map.get(page_key, tail_map["index"])
-        tail = tail_template.format(
-            idx=idx, idx_after=idx_after,
-            cov=cov, cov_after=cov_after,
-            map_data=map_data, map_tiles=map_tiles,
-            embed_gh=embed_gh,
-        )
 
-        new_disclaimer = f'<p class="disclaimer"><strong>Reroute NJ</strong> {disclaimer}{tail}</p>'
-        html = re.sub(
-            r'<p class="disclaimer">.*?</p>',
-            new_disclaimer,
-            html,
-            flags=re.DOTALL
-        )
+def replace_footer(page, translations, page_key):
+    """Replace footer text with full per-page translations."""
+    new_disclaimer = footer_disclaimer(translations, page_key)
+    if new_disclaimer:
+        page.replace_between('<p class="disclaimer">', '</p>', new_disclaimer)
 
+    built_by = get_translation(translations, "common.footer_built_by")
     if built_by:
-        html = re.sub(
-            r'Built by',
-            built_by,
-            html,
-            count=1
-        )
+        page.replace('Built by', built_by, count=1)
 
     # Translate "About our methodology" footer link
     about_link_text = get_translation(translations, "about.heading") or "About our methodology"
-    html = html.replace('>About our methodology</a>', f'>{about_link_text}</a>')
-
-    return html
+    page.replace('>About our methodology</a>', f'>{about_link_text}</a>')
 
 
-def inject_translations_script(html, translations, page_name):
-    """Inject window._T before i18n.js so translations load synchronously."""
-    # Only include the sections needed at runtime (js, common, compare, coverage)
-    runtime_keys = ["common", "js", "compare", "coverage", "card"]
+@per_translations
+def runtime_translations_json(translations):
+    """Serialize the runtime subset of a language's translations (once per language)."""
     runtime_t = {}
-    for key in runtime_keys:
+    for key in RUNTIME_KEYS:
         if key in translations:
             runtime_t[key] = translations[key]
+    return json.dumps(runtime_t, ensure_ascii=False, separators=(",", ":"))
 
-    t_json = json.dumps(runtime_t, ensure_ascii=False, separators=(",", ":"))
 
+@per_translations
+def runtime_script(translations, depth):
+    """Build the inline BASE_PATH/_T script for a language and output depth."""
     # Depth-aware BASE_PATH: root pages get ../, nested pages get ../../
-    depth = page_name.count('/') + 1  # +1 for the lang directory
     base_path = '../' * depth
-    js_path = f'{base_path}js/i18n.js'
-
-    inject = f'<script>window.BASE_PATH="{base_path}";window._T={t_json};</script>\n  '
+    t_json = runtime_translations_json(translations)
+    return f'<script>window.BASE_PATH="{base_path}";window._T={t_json};</script>\n  '
 
-    # Find the i18n.js script tag (path varies by depth)
-    for prefix in ['../../', '../']:
-        old_tag = f'<script src="{prefix}js/i18n.js"></script>'
-        if old_tag in html:
-            html = html.replace(old_tag, inject + f'<script src="{prefix}js/i18n.js"></script>')
-            break
 
-    return html
+def inject_translations_script(page, translations, page_name):
+    """Inject window._T before i18n.js so translations load synchronously."""
+    depth = page_name.count('/') + 1  # +1 for the lang directory
+    inject = runtime_script(translations, depth)
 
+    # The English template's i18n.js tag is one level shallower than the output
+    template_prefix = '../' * (depth - 1)
+    page.insert_before(f'<script src="{template_prefix}js/i18n.js"></script>', inject)
 
-def add_hreflang_tags(html, page_name):
-    """Add hreflang link tags for SEO (skips if already present in source)."""
-    if 'hreflang=' in html:
-        return html
 
+@functools.lru_cache(maxsize=None)
+def hreflang_block(page_name):
+    """Build the hreflang <link> block for a page (same for every language)."""
     tags = []
     # index.html at the root redirects to / on GitHub Pages — use the canonical URL
     en_url = "https://reroutenj.org/" if page_name == "index.html" else f"https://reroutenj.org/{page_name}"
@@ -347,14 +631,19 @@ def add_hreflang_tags(html, page_name):
     # Add x-default pointing to English
     tags.append(f'  <link rel="alternate" hreflang="x-default" href="{en_url}">')
 
-    hreflang_block = "\n".join(tags)
+    return "\n".join(tags)
+
+
+def add_hreflang_tags(page, page_name):
+    """Add hreflang link tags for SEO (skips if already present in source)."""
+    if 'hreflang=' in page:
+        return
 
     # Insert before </head>
-    html = html.replace("</head>", f"{hreflang_block}\n</head>")
-    return html
+    page.insert_before("</head>", f"{hreflang_block(page_name)}\n", count=1)
 
 
-def replace_hamburger_label(html, translations, page_key):
+def replace_hamburger_label(page, translations, page_key):
     """Replace the mobile hamburger menu label with translated nav text."""
     label_map = {
         "index": "common.nav_line_guide",
@@ -384,20 +673,283 @@ def replace_hamburger_label(html, translations, page_key):
         translated = get_translation(translations, key)
         if translated:
             escaped = translated.replace("&", "&amp;")
-            html = html.replace(
+            page.replace(
                 f'<span class="hamburger-label">{eng}</span>',
                 f'<span class="hamburger-label">{escaped}</span>'
             )
-    return html
 
 
-def replace_page_specific_content(html, translations, page_key):
-    """Replace page-specific static content using translation keys."""
+# Page-specific English snippets, keyed by translation key. Stored as they
+# appear in the templates (entities included).
+
+# index.html Secaucus card list items
+INDEX_SECAUCUS_ITEMS = {
+    "index.secaucus_transfer_item1": '<strong>Allow extra time.</strong> Connections that normally take 5–10 minutes may take 15–25 minutes due to single-track delays.',
+    "index.secaucus_transfer_item2": '<strong>Fewer trains means fewer connections.</strong> Check the temporary schedule for your specific connection — some may be eliminated.',
+    "index.secaucus_transfer_item3": '<strong>Follow the signs.</strong> NJ Transit is deploying extra staff at Secaucus to help with wayfinding and crowd management.',
+    "index.secaucus_transfer_item4": '<strong>Have a backup plan.</strong> If you miss a connection, know your next option (next train, or bus alternative).',
+    "index.secaucus_avoid_item1": '<strong>Hoboken-diverted lines (M-B, M&amp;E, Gladstone):</strong> Your trains go to Hoboken, not through Secaucus. The bottleneck doesn\'t directly affect you.',
+    "index.secaucus_avoid_item2": '<strong>Consider Hoboken as your hub.</strong> If you can get to a Morris &amp; Essex or Montclair-Boonton station, routing through Hoboken may be faster than fighting through Secaucus.',
+    "index.secaucus_avoid_item3": '<strong>Bus alternatives:</strong> NJ Transit buses that go directly to Port Authority skip Secaucus entirely.',
+    "index.secaucus_avoid_item4": '<strong>Drive to Newark Penn:</strong> If you normally drive to a station, consider driving directly to Newark Penn Station for a more direct NEC train to PSNY.',
+    "index.secaucus_delays_item1": '<strong>Peak hours (7–9am, 5–7pm):</strong> Delays of 15–30+ minutes are likely at Secaucus due to single-track operations.',
+    "index.secaucus_delays_item2": '<strong>Off-peak:</strong> Delays should be shorter but still expect 5–15 minutes of added travel time.',
+    "index.secaucus_delays_item3": '<strong>Cascading delays:</strong> A delay on one line backs up all lines sharing the single track. One late train affects everything behind it.',
+    "index.secaucus_delays_item4": '<strong>Check real-time status:</strong> Use the NJ Transit app or <a href="https://www.njtransit.com/travel-alerts-to" target="_blank" rel="noopener">njtransit.com travel alerts</a> before leaving home.',
+}
+
+# index.html timeline events: (title key, English title, desc key, English desc)
+INDEX_TL_EVENTS = [
+    ("index.tl_announce_title", "Cutover announced",
+     "index.tl_announce_desc", "NJ Transit and Amtrak announce the Portal North Bridge cutover schedule and temporary service changes."),
+    ("index.tl_tickets_title", "New ticket rules begin",
+     "index.tl_tickets_desc", "Midtown Direct riders should start buying Hoboken monthly passes (valid for Penn Station travel Feb 1–15)."),
+    ("index.tl_start_title", "Phase 1 begins",
+     "index.tl_start_desc", "Temporary schedules take effect. Midtown Direct weekday trains diverted to Hoboken. Single-track operation between Newark and Secaucus."),
+    ("index.tl_end_title", "Phase 1 complete",
+     "index.tl_end_desc", "Regular NJ Transit schedules resumed. First track on the new Portal North Bridge enters passenger service March 16."),
+    ("index.tl_phase2_title", "Phase 2",
+     "index.tl_phase2_desc", "Second track cutover. Similar service disruptions expected. Dates TBA. After this, the old Portal Bridge is permanently retired."),
+]
+
+# index.html resource links: (title key, English title, desc key, English desc)
+INDEX_RES_LINKS = [
+    ("index.res_cutover_title", "NJ Transit cutover page",
+     "index.res_cutover_desc", "Official schedules, maps, and FAQs"),
+    ("index.res_schedules_title", "Temporary train schedules",
+     "index.res_schedules_desc", "Line-by-line PDF schedules for Feb 15 – Mar 15"),
+    ("index.res_alerts_title", "Real-time travel alerts",
+     "index.res_alerts_desc", "Live service status and delay notifications"),
+    ("index.res_path_title", "PATH train schedules",
+     "index.res_path_desc", "Hoboken – 33rd Street service info"),
+    ("index.res_ferry_title", "NY Waterway ferries",
+     "index.res_ferry_desc", "Hoboken – Midtown ferry schedules"),
+]
+
+# map.html bridge card list items
+MAP_BRIDGE_ITEMS = {
+    "map.old_bridge_item1": 'Built in <strong>1910</strong> &mdash; 115 years old',
+    "map.old_bridge_item2": 'Swing bridge design that opens for marine traffic',
+    "map.old_bridge_item3": 'Frequently gets stuck, causing hours of delay',
+    "map.old_bridge_item4": 'Carries every NJ Transit and Amtrak train on the Northeast Corridor',
+    "map.new_bridge_item1": 'Portal North Bridge: $1.5 billion replacement',
+    "map.new_bridge_item2": 'Fixed-span design &mdash; never opens, never gets stuck',
+    "map.new_bridge_item3": '50 feet higher than the old bridge, allowing boats to pass underneath',
+    "map.new_bridge_item4": 'Part of the larger Gateway Program to modernize the corridor',
+    "map.cutover_item1": '<strong>Phase 1</strong> (Feb 15 &ndash; Mar 15, 2026): First track transferred to new bridge',
+    "map.cutover_item2": 'Requires single-track operations between Newark and Secaucus',
+    "map.cutover_item3": '50% service reduction across all lines',
+    "map.cutover_item4": '<strong>Phase 2</strong> (Fall 2026): Second track transferred, old bridge retired',
+}
+
+# embed.html publisher card items
+EMBED_PUB_ITEMS = {
+    "embed.pub_embed_item1": "Use the configurator above to generate embed code for any format.",
+    "embed.pub_embed_item2": 'Paste into your CMS (WordPress, Ghost, Squarespace, etc.) &mdash; most support raw HTML blocks.',
+    "embed.pub_embed_item3": "The embeds are responsive and work on mobile.",
+    "embed.pub_embed_item4": "No API key or account needed.",
+    "embed.pub_link_item1": 'Add a "Plan your commute" link box to your Portal Bridge stories.',
+    "embed.pub_link_item2": "Link to specific tools based on what the article covers.",
+    "embed.pub_link_item3": "OG images and social cards are already set up for clean previews.",
+    "embed.pub_link_item4": 'Suggested anchor text: "Use the free Reroute NJ tool to plan your commute."',
+    "embed.pub_contribute_item1": 'We curate Portal Bridge coverage on our <a href="coverage.html">news coverage page</a>.',
+    "embed.pub_contribute_item2": 'To suggest an article, <a href="https://github.com/jamditis/reroute-nj/issues/new?template=article-suggestion.md" target="_blank" rel="noopener">open a GitHub issue</a>.',
+    "embed.pub_contribute_item3": 'Or email <strong><a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a></strong> with "Reroute NJ coverage" in the subject.',
+    "embed.pub_contribute_item4": "We include all relevant coverage &mdash; opinion, analysis, community reporting, and more.",
+}
+
+# embed.html fork steps
+EMBED_FORK_STEPS = {
+    "embed.fork_step1": 'Fork the <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">GitHub repository</a> to your organization\'s account.',
+    "embed.fork_step2": 'Edit <code>css/styles.css</code> to change colors, fonts, and branding. All theme values are CSS custom properties in the <code>:root</code> block.',
+    "embed.fork_step3": 'Replace the brand name, logo, and footer credit with your own.',
+    "embed.fork_step4": 'Deploy to GitHub Pages, Netlify, Vercel, or your own server. No build step required.',
+}
+
+# embed.html contribute card items
+EMBED_CONTRIBUTE_ITEMS = {
+    "embed.nontechnical_item1": '<strong>Submit article suggestions:</strong> Know of a Portal Bridge article we missed? <a href="https://github.com/jamditis/reroute-nj/issues/new?template=article-suggestion.md" target="_blank" rel="noopener">Open an issue</a> or email joe@amditis.com.',
+    "embed.nontechnical_item2": '<strong>Report inaccuracies:</strong> If schedule data or transfer times are wrong, let us know.',
+    "embed.nontechnical_item3": '<strong>Share the tool:</strong> Tell your commuter friends, share on social media, post in your neighborhood group.',
+    "embed.technical_item1": '<strong>File bugs:</strong> Found a bug? <a href="https://github.com/jamditis/reroute-nj/issues" target="_blank" rel="noopener">Open an issue on GitHub</a>.',
+    "embed.technical_item2": '<strong>Submit a pull request:</strong> The codebase is vanilla HTML/CSS/JS with no build step. Fork, change, PR.',
+    "embed.technical_item3": '<strong>Add data:</strong> Help us keep <code>data/coverage.json</code> up to date with new articles.',
+    "embed.technical_item4": '<strong>Improve accessibility:</strong> Screen reader testing, WCAG compliance, keyboard navigation.',
+    "embed.license_item1": 'Reroute NJ is released under the <strong>MIT License</strong>.',
+    "embed.license_item2": 'You can use, copy, modify, and distribute it freely.',
+    "embed.license_item3": 'Attribution is appreciated but not required.',
+    "embed.license_item4": 'The project is maintained by <a href="https://github.com/jamditis" target="_blank" rel="noopener">Joe Amditis</a>.',
+}
+
+# blog/why-we-built-reroute-nj.html tool description paragraphs
+BLOG_POST_TOOL_ITEMS = {
+    "blog_post.tool_line_guide": '<strong><a href="../index.html">Line guide</a></strong> &mdash; Select your NJ Transit line and station to see exactly how your commute changes, what alternative routes are available, and what tickets you need. Works for both directions: morning commuters heading into NYC and evening commuters heading home.',
+    "blog_post.tool_compare": '<strong><a href="../compare.html">Commute comparison</a></strong> &mdash; Pick your NJ station and your Manhattan destination, and see every route option side by side with visual time breakdowns. PATH vs. ferry vs. bus, ranked by total travel time, with cost and transfer details.',
+    "blog_post.tool_coverage": '<strong><a href="../coverage.html">News coverage</a></strong> &mdash; Curated reporting about the cutover from more than a dozen regional news sources. Filter by source, line, direction, or category.',
+    "blog_post.tool_map": '<strong><a href="../map.html">Interactive map</a></strong> &mdash; All five affected NJ Transit lines rendered on a map with station markers, key transfer points (Hoboken Terminal, Secaucus Junction, Newark Penn), and the Portal Bridge location over the Hackensack River.',
+    "blog_post.tool_embed": '<strong><a href="../embed.html">Embed and share</a></strong> &mdash; Iframe embed codes, direct links, and instructions for newsrooms and publishers who want to republish any of these tools on their own sites.',
+}
+
+# blog/why-we-built-reroute-nj.html newsroom list items
+BLOG_POST_NEWSROOMS_ITEMS = {
+    "blog_post.newsrooms_item1": '<strong>Embed any tool</strong> on your website using our <a href="../embed.html">embed code generator</a>. Copy and paste an iframe.',
+    "blog_post.newsrooms_item2": '<strong>Link to the tools</strong> from your Portal Bridge coverage. The URLs are permanent and have social meta tags for clean previews.',
+    "blog_post.newsrooms_item3": '<strong>Fork the project</strong> and run your own branded version. The <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">code is MIT-licensed</a>. Change the colors, add your logo, deploy it on your own domain.',
+    "blog_post.newsrooms_item4": '<strong>Add your coverage</strong> to our <a href="../coverage.html">news feed</a>. <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">Open a GitHub issue</a> or email <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> with your article links.',
+}
+
+# blog/why-we-built-reroute-nj.html "how you can help" list items
+BLOG_POST_HELP_ITEMS = {
+    "blog_post.help_item1": '<strong>Share the tool.</strong> Text it to your train friends. Post it in your town\'s Facebook group. The more people who know about it, the better it works.',
+    "blog_post.help_item2": '<strong>Report inaccuracies.</strong> If a travel time estimate is wrong, or a schedule change isn\'t reflected, <a href="https://github.com/jamditis/reroute-nj/issues" target="_blank" rel="noopener">let us know</a>.',
+    "blog_post.help_item3": '<strong>Suggest articles.</strong> Found good Portal Bridge coverage we haven\'t listed? <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">Submit it</a>.',
+    "blog_post.help_item4": '<strong>Contribute code.</strong> The <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">GitHub repo</a> is open. No build step, no framework knowledge required. If you can edit HTML, you can contribute.',
+    "blog_post.help_item5": '<strong>Help with accessibility.</strong> We want the tool to work for everyone. Screen reader testing, keyboard navigation improvements, and WCAG compliance review are all welcome.',
+}
+
+# blog/bridge-opens.html "what it means" list items
+BLOG_POST_BRIDGE_WM_ITEMS = {
+    "blog_post_bridge.wm_hoboken": '<strong>Montclair-Boonton and Morris &amp; Essex lines</strong> return to New York Penn Station. No more Hoboken diversions.',
+    "blog_post_bridge.wm_full_service": '<strong>Northeast Corridor and North Jersey Coast Line</strong> resume full service frequency.',
+    "blog_post_bridge.wm_raritan": '<strong>Raritan Valley Line</strong> restores one-seat rides to Penn Station.',
+}
+
+# blog/cutover-begins.html "need to know" list items
+BLOG_POST_CUTOVER_NTK_ITEMS = {
+    "blog_post_cutover.ntk_hoboken": '<strong>Montclair-Boonton and Morris &amp; Essex lines</strong> are diverted to Hoboken Terminal instead of New York Penn Station. From Hoboken, you transfer to PATH, ferry, or bus to reach Manhattan.',
+    "blog_post_cutover.ntk_reduced": '<strong>Northeast Corridor and North Jersey Coast Line</strong> continue to New York Penn Station but with reduced frequency. Fewer trains, longer waits.',
+    "blog_post_cutover.ntk_newark": '<strong>Raritan Valley Line</strong> loses all one-seat rides to Penn Station. Trains terminate at Newark Penn Station. Transfer to Northeast Corridor or PATH from there.',
+}
+
+# blog/cutover-begins.html tool description paragraphs
+BLOG_POST_CUTOVER_TOOL_ITEMS = {
+    "blog_post_cutover.tool_line_guide": '<strong><a href="../index.html">Line guide</a></strong> &mdash; Select your line and station to see exactly how your commute changes, what alternative routes are available, and what tickets you need.',
+    "blog_post_cutover.tool_compare": '<strong><a href="../compare.html">Commute comparison</a></strong> &mdash; Pick your NJ station and your Manhattan destination, then see every route option side by side with travel times, costs, and transfer details.',
+    "blog_post_cutover.tool_coverage": '<strong><a href="../coverage.html">News coverage</a></strong> &mdash; Reporting about the cutover from local and regional news sources, updated throughout the day. Filter by source, line, or category.',
+    "blog_post_cutover.tool_map": '<strong><a href="../map.html">Interactive map</a></strong> &mdash; All five affected lines rendered on a map with station markers, transfer points, and the Portal Bridge location.',
+    "blog_post_cutover.tool_embed": '<strong><a href="../embed.html">Embed and share</a></strong> &mdash; Embed codes and tools for newsrooms and publishers who want to put these resources on their own sites.',
+}
+
+# blog/new-embed-system.html body paragraphs
+BLOG_POST_EMBED_PARA_MAP = {
+    "blog_post_embed.intro_p1": "The Portal Bridge cutover starts Saturday. If you cover transit in New Jersey &mdash; or if you run a community site, town Facebook page, or commuter forum &mdash; you can now put Reroute NJ tools directly on your website.",
+    "blog_post_embed.intro_p2": "We just shipped a full embed system. Four output formats, a visual configurator that builds the embed code for you, and PNG export for social media and email newsletters. Everything is free to use.",
+    "blog_post_embed.format_cards": '<strong>Info cards</strong> &mdash; Compact cards showing line impact, station details, or a full cutover summary. Drop one into an article sidebar or at the top of a liveblog. Three card types: line cards (one line\'s impact), station cards (one station\'s changes), and summary cards (all five lines at a glance).',
+    "blog_post_embed.format_widgets": '<strong>Interactive widgets</strong> &mdash; Mini versions of the line guide, comparison tool, news feed, or map. These are live, working tools that readers can interact with inside your page. Pick a tool and it loads in an iframe sized to fit.',
+    "blog_post_embed.format_full": '<strong>Full tool embeds</strong> &mdash; Any Reroute NJ page with the header and footer stripped out. Append <code>?embed=true</code> to any tool URL and it becomes embeddable. Good for dedicated cutover pages where you want to give readers the complete experience.',
+    "blog_post_embed.format_script": '<strong>Script-tag embeds</strong> &mdash; A single <code>&lt;script&gt;</code> tag and a <code>&lt;div&gt;</code>. No iframe configuration needed. Add the div with data attributes for the embed type, line, and station, include the script, and it handles the rest. Works in CMSes where pasting iframe code is restricted.',
+    "blog_post_embed.configurator_p1": 'The <a href="../embed.html">embed page</a> has a visual configurator that walks you through choosing your embed type, selecting the line and station, picking a theme (light or dark), and setting a custom accent color. It shows a live preview and gives you copy-paste code in all four formats.',
+    "blog_post_embed.configurator_p2": 'For info cards, you also get a <strong>Download PNG</strong> button that renders the card to a high-fidelity image. The PNG export uses Canvas rendering (not a screenshot), so text stays sharp at any size. Use it in newsletters, tweets, or print handouts.',
+    "blog_post_embed.configurator_p3": 'There\'s also a <strong>Download HTML</strong> option that gives you a self-contained file with all styles and data bundled in. No external dependencies, no network requests. Open it in a browser and it works offline.',
+    "blog_post_embed.customization_intro": "Every embed supports two customization options:",
+    "blog_post_embed.customization_outro": "Match the embed to your site\'s design without touching any code.",
+    "blog_post_embed.newsrooms_p1": "We built this for you. The cutover will dominate transit coverage in the region for a month, and your readers need tools, not just articles. A line card in your sidebar tells a Montclair-Boonton commuter exactly what changes for them. A comparison widget lets a reader punch in their station and see every alternative route.",
+    "blog_post_embed.newsrooms_p2": 'The embed codes work on WordPress, Squarespace, Ghost, Substack (with the script-tag format), and any platform that accepts HTML. If you run into trouble embedding on your specific platform, <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">open an issue</a> or email <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> and we\'ll help.',
+    "blog_post_embed.newsrooms_p3": 'Everything is MIT-licensed. No attribution required, though we appreciate a link back to <a href="https://reroutenj.org">reroutenj.org</a>.',
+    "blog_post_embed.whatelse_intro": "Along with the embed system, this release includes:",
+    "blog_post_embed.tryit_p1": 'Go to the <a href="../embed.html">embed configurator</a>, pick a format, and copy the code. It takes about 30 seconds.',
+    "blog_post_embed.tryit_p2": 'If you embed Reroute NJ on your site, we\'d like to know about it. Drop us a line at <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> &mdash; we\'ll add your site to our <a href="../coverage.html">coverage page</a>.',
+}
+
+# blog/new-embed-system.html h2 headings
+BLOG_POST_EMBED_H2_MAP = [
+    ("blog_post_embed.h2_formats", "Four ways to embed"),
+    ("blog_post_embed.h2_configurator", "The configurator"),
+    ("blog_post_embed.h2_customization", "Customization"),
+    ("blog_post_embed.h2_newsrooms", "For newsrooms"),
+    ("blog_post_embed.h2_whatelse", "What else is new"),
+    ("blog_post_embed.h2_tryit", "Try it"),
+]
+
+# blog/new-embed-system.html list items
+BLOG_POST_EMBED_LI_MAP = {
+    "blog_post_embed.customization_theme": '<strong>Theme</strong> &mdash; Light or dark. Append <code>&amp;theme=dark</code> to any embed URL or set <code>data-theme="dark"</code> on the script-tag div.',
+    "blog_post_embed.customization_accent": '<strong>Accent color</strong> &mdash; Any hex color. Append <code>&amp;accent=FF6B35</code> or set <code>data-accent="FF6B35"</code>. The accent applies to CTA buttons and color highlights.',
+    "blog_post_embed.whatelse_blog": "<strong>Blog in all 11 languages</strong> &mdash; Blog posts are now translated alongside the rest of the site. The blog has its own index page with a proper post structure.",
+    "blog_post_embed.whatelse_seo": '<strong>SEO and AI search optimization</strong> &mdash; Structured data (JSON-LD), full hreflang cross-references, <code>robots.txt</code> with AI bot guidance, <code>llms.txt</code> for AI search engines, and <code>sitemap.xml</code> covering all 79 pages.',
+    "blog_post_embed.whatelse_html": "<strong>Self-contained HTML downloads</strong> &mdash; Export any info card as a standalone HTML file that works without an internet connection.",
+}
+
+# about.html h2 headings
+ABOUT_H2_MAP = [
+    ("about.h2_translations", "How we produce translations"),
+    ("about.h2_verification", "How we verify transit data"),
+    ("about.h2_accessibility", "Our accessibility standards"),
+    ("about.h2_philosophy", "Why we built it this way"),
+    ("about.h2_mistakes", "What we get wrong"),
+]
+
+# about.html body paragraphs
+ABOUT_PARA_MAP = {
+    "about.translations_p1": 'Every tool on this site is available in 11 languages: English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These languages were chosen because they are the most commonly spoken languages in New Jersey according to U.S. Census data.',
+    "about.translations_p2": 'Translations are produced with the help of AI language models and reviewed for natural phrasing and accuracy. Each language gets its own complete set of HTML pages with translated navigation, labels, headings, descriptions, accessibility text, and metadata. This is not a browser auto-translate overlay &mdash; every translated page is a standalone document that works without JavaScript if necessary.',
+    "about.translations_rules": "We follow specific rules about what gets translated and what doesn't:",
+    "about.translations_fidelity": 'This is a deliberate choice: fidelity to what riders actually see and hear at the station matters more than linguistic consistency. A Spanish-speaking commuter looking at their phone needs to read "Tome el tren a Hoboken Terminal" &mdash; not "Tome el tren a Terminal de Hoboken" &mdash; because the sign above the platform says "Hoboken Terminal."',
+    "about.verification_p1": 'Every claim on this site &mdash; train counts, schedule changes, fare information, transfer directions &mdash; is traceable to an official source. We maintain a <a href="https://github.com/jamditis/reroute-nj/blob/main/data/sources.json" target="_blank" rel="noopener">citation database</a> linking 28 specific claims to the official NJ Transit, Amtrak, PATH, and NY Waterway pages they come from.',
+    "about.verification_intro": "Our verification process:",
+    "about.accessibility_p1": 'Accessibility is not a feature we added &mdash; it\'s a constraint we designed around. The site meets WCAG 2.1 AA, the international standard for web accessibility.',
+    "about.accessibility_intro": "What that means in practice:",
+    "about.philosophy_p1": "Reroute NJ is a plain HTML, CSS, and JavaScript site. No frameworks, no build step, no server, no database. This isn't a technology preference &mdash; it's a reliability decision.",
+    "about.philosophy_p2": "During the cutover, hundreds of thousands of commuters will need this information at peak hours. A static site served from a CDN handles traffic spikes without breaking. It works on old phones, slow connections, and every browser. There's no server to go down, no API to rate-limit, no dependency to break.",
+    "about.philosophy_p3": "The tools are designed for someone checking their phone at 6:30 in the morning, standing on a platform, trying to figure out if their train still runs. That person needs a clear answer fast. They don't need animations, loading spinners, or a signup form. Every design decision starts from that scenario.",
+    "about.mistakes_p1": "We make mistakes. When we find them, we fix them and document the change. A few things to know:",
+    "about.mistakes_p2": 'This is an independent project. We are not affiliated with NJ Transit, Amtrak, or any government agency. Always verify critical travel information at <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> before traveling.',
+}
+
+# about.html list items
+ABOUT_LI_MAP = {
+    "about.li_stations": "<strong>Station names stay in English.</strong> \"Secaucus Junction\" is what's on the platform sign. Translating it would make it harder to find your train, not easier.",
+    "about.li_lines": '<strong>Line names stay in English.</strong> "Northeast Corridor" and "Montclair-Boonton Line" are official NJ Transit designations. They appear in English on every schedule, app, and sign.',
+    "about.li_places": '<strong>Place names stay in English.</strong> "Hoboken Terminal," "Penn Station New York," and "Port Authority" are proper nouns. Riders need to match what they see to what they read.',
+    "about.li_everything_else": "<strong>Everything else is translated.</strong> Instructions, descriptions, labels, navigation, button text, accessibility announcements, error messages, and page metadata are all translated into each language.",
+    "about.li_official_sources": '<strong>Official sources first.</strong> Train counts, diversions, cross-honoring policies, and fare information come from <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com/portalcutover</a> and official NJ Transit press releases. We do not use secondhand reporting as a primary source for transit data.',
+    "about.li_automated_validation": "<strong>Automated validation.</strong> We run 698+ automated checks across 14 test suites that verify data structure, transit facts, cross-references between pages, HTML integrity, translation completeness, and accessibility compliance. These tests run before every change is published.",
+    "about.li_automated_monitoring": "<strong>Automated monitoring.</strong> A scraper checks official NJ Transit and Amtrak pages four times a day for schedule or policy changes. When content changes, we review and update the site.",
+    "about.li_source_attribution": "<strong>Source attribution on every page.</strong> Each line guide card and commute comparison result includes links to the official sources backing its claims, so riders can verify for themselves.",
+    "about.li_open_source": '<strong>Open source.</strong> The entire codebase, all data files, and all test suites are <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">public on GitHub</a>. Anyone can inspect, challenge, or correct the data.',
+    "about.li_high_contrast": "<strong>High contrast mode.</strong> A toggle on every page switches to a high-contrast color scheme for riders with low vision. The setting persists across pages.",
+    "about.li_simplified": "<strong>Simplified view.</strong> Strips decorative elements to reduce visual noise for riders who need fewer distractions.",
+    "about.li_keyboard": "<strong>Keyboard navigation.</strong> Every control is reachable by keyboard. Focus indicators are visible. The tab order follows the visual layout.",
+    "about.li_screenreader": "<strong>Screen reader support.</strong> ARIA labels, roles, and live regions let screen readers announce content changes. Skip-to-content links on every page.",
+    "about.li_touch": "<strong>Touch targets.</strong> All buttons and controls are at least 44 pixels on mobile &mdash; large enough to tap accurately on a bumpy train.",
+    "about.li_rtl": "<strong>Right-to-left support.</strong> The Arabic translation renders with proper right-to-left layout, text direction, and mirrored navigation.",
+    "about.li_print": "<strong>Print stylesheets.</strong> Every page prints cleanly for riders who want a paper backup.",
+    "about.li_travel_times": '<strong>Travel time estimates are approximations.</strong> We use published schedules and average travel times, not live data. Actual times will vary, especially during the cutover when the system is under stress.',
+    "about.li_schedules_change": "<strong>Schedules change.</strong> NJ Transit may adjust service during the cutover based on ridership patterns. We monitor for changes four times a day, but there may be a delay between an official update and our site reflecting it.",
+    "about.li_translation_errors": '<strong>Translations may have errors.</strong> While we work to make translations natural and accurate, we rely on AI-assisted translation. If you find an error in any language, please <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">report it</a> and we\'ll fix it.',
+}
+
+
+def page_replacements(translations, page_key):
+    """Build a page's {english snippet: translation} table.
+
+    Each English snippet/translation pair is registered with replace(); the
+    whole table is later applied in a single pass by apply_replacements().
+    """
+    replacements = {}
+
+    def replace(eng, translated):
+        # First registration wins, matching the old sequential str.replace order
+        replacements.setdefault(eng, translated)
+
+    def replace_apostrophes(eng, translated):
+        # Templates spell apostrophes either as ' or as &#x27;, so register both
+        straight = eng.replace("&#x27;", "'")
+        replace(straight, translated)
+        replace(straight.replace("'", "&#x27;"), translated)
+
+    def replace_wrapped(pairs, opener, closer):
+        # Swap the English text between opener and closer for each (key, text)
+        for key, eng_text in pairs:
+            translated = get_translation(translations, key)
+            if translated:
+                replace(f"{opener}{eng_text}{closer}", f"{opener}{translated}{closer}")
+
     if page_key == "index":
         # Phase banner injection
         phase_banner = get_translation(translations, "common.phase_banner")
         if phase_banner:
-            html = html.replace(
+            replace(
                 '<main class="container" id="main-content">',
                 f'<main class="container" id="main-content">\n    <div class="phase-banner">{phase_banner}</div>'
             )
@@ -405,7 +957,7 @@ def replace_page_specific_content(html, translations, page_key):
         # SEO summary
         seo_summary = get_translation(translations, "index.seo_summary")
         if seo_summary:
-            html = html.replace(
+            replace(
                 "During the Phase 1 cutover (February 15 – March 15, 2026), NJ Transit rail service was reduced by approximately 50% as Amtrak connected the new Portal North Bridge. This tool shows how each line and station was affected. Phase 2 is expected fall 2026.",
                 seo_summary
             )
@@ -414,9 +966,9 @@ def replace_page_specific_content(html, translations, page_key):
         phase1 = get_translation(translations, "index.alert_phase1")
         details = get_translation(translations, "index.alert_details")
         if phase1:
-            html = html.replace('<strong>Phase 1 complete!</strong>', f'<strong>{phase1}</strong>')
+            replace('<strong>Phase 1 complete!</strong>', f'<strong>{phase1}</strong>')
         if details:
-            html = html.replace(
+            replace(
                 'Regular NJ Transit schedules resumed Mar 15 &middot; First track on the new Portal North Bridge enters service Mar 16 &middot; Phase 2 (second track) expected Fall 2026',
                 details.replace("&", "&amp;").replace("·", "&middot;")
             )
@@ -426,12 +978,12 @@ def replace_page_specific_content(html, translations, page_key):
         choose_station = get_translation(translations, "index.choose_station")
         direction_label = get_translation(translations, "index.direction_label")
         if your_station:
-            html = html.replace('>Your station</label>', f'>{your_station}</label>')
+            replace('>Your station</label>', f'>{your_station}</label>')
         if choose_station:
-            html = html.replace('Choose your station&hellip;', choose_station)
+            replace('Choose your station&hellip;', choose_station)
         if direction_label:
-            html = html.replace('>Direction of travel</label>', f'>{direction_label}</label>')
-            html = html.replace('>Direction of travel</span>', f'>{direction_label}</span>')
+            replace('>Direction of travel</label>', f'>{direction_label}</label>')
+            replace('>Direction of travel</span>', f'>{direction_label}</span>')
 
         # Direction buttons (HTML uses &rarr; entities and dir-sub class)
         nj_nyc = get_translation(translations, "index.nj_to_nyc")
@@ -439,12 +991,12 @@ def replace_page_specific_content(html, translations, page_key):
         morning = get_translation(translations, "index.morning_commute")
         evening = get_translation(translations, "index.evening_commute")
         if nj_nyc and morning:
-            html = html.replace(
+            replace(
                 'NJ &rarr; NYC <span class="dir-sub">morning commute</span>',
                 nj_nyc.replace("→", "&rarr;") + f' <span class="dir-sub">{morning}</span>'
             )
         if nyc_nj and evening:
-            html = html.replace(
+            replace(
                 'NYC &rarr; NJ <span class="dir-sub">evening commute</span>',
                 nyc_nj.replace("→", "&rarr;") + f' <span class="dir-sub">{evening}</span>'
             )
@@ -454,47 +1006,44 @@ def replace_page_specific_content(html, translations, page_key):
         tab_routes = get_translation(translations, "index.tab_routes")
         tab_tickets = get_translation(translations, "index.tab_tickets")
         if tab_affected:
-            html = html.replace('>Am I affected?</button>', f'>{tab_affected}</button>')
+            replace('>Am I affected?</button>', f'>{tab_affected}</button>')
         if tab_routes:
-            html = html.replace('>Route planner</button>', f'>{tab_routes}</button>')
+            replace('>Route planner</button>', f'>{tab_routes}</button>')
         if tab_tickets:
-            html = html.replace('>Ticket guide</button>', f'>{tab_tickets}</button>')
+            replace('>Ticket guide</button>', f'>{tab_tickets}</button>')
 
         # Impact empty state
         ami = get_translation(translations, "index.am_i_affected")
         select_line = get_translation(translations, "index.select_line_station")
         if ami:
             # Panel intro has h2, impact-empty has h3
-            html = re.sub(r'(<h[23]>)Am I affected\?(</h[23]>)', lambda m: m.group(1) + ami + m.group(2), html)
+            replace("<h2>Am I affected?</h2>", f"<h2>{ami}</h2>")
+            replace("<h3>Am I affected?</h3>", f"<h3>{ami}</h3>")
         if select_line:
-            html = re.sub(
-                r'Select your line and station above to see exactly how the cutover changes your commute\.',
-                select_line,
-                html
+            replace(
+                "Select your line and station above to see exactly how the cutover changes your commute.",
+                select_line
             )
 
         # Stat labels
         lines_aff = get_translation(translations, "index.lines_affected")
         svc_red = get_translation(translations, "index.service_reduction")
         if lines_aff:
-            html = html.replace('>lines affected<', f'>{lines_aff}<')
+            replace('>lines affected<', f'>{lines_aff}<')
         if svc_red:
-            html = html.replace('>service reduction<', f'>{svc_red}<')
+            replace('>service reduction<', f'>{svc_red}<')
 
         # Section headings
-        for key, eng_text in [
+        replace_wrapped([
             ("index.cutover_summary_title", "How the cutover affects your commute"),
             ("index.hoboken_terminal_title", "Navigating Hoboken Terminal"),
             ("index.compare_callout_title", "Want to compare all your options side by side?"),
             ("index.secaucus_title", "Secaucus Junction: the choke point"),
             ("index.timeline_title", "Timeline"),
             ("index.resources_title", "Official resources"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
 
-        # Section descriptions
+        # Section descriptions (bare text, no wrapping markup)
         for key, eng_text in [
             ("index.cutover_summary_desc", "Starting February 15, the Portal North Bridge connection will reduce NJ Transit service for four weeks. Select your line and station above to see exactly what changes for you."),
             ("index.hoboken_terminal_desc", "If your line is diverted to Hoboken, you may be arriving at Hoboken Terminal for the first time. Here's how to get from your train to PATH, the ferry, or Bus 126."),
@@ -502,36 +1051,36 @@ def replace_page_specific_content(html, translations, page_key):
         ]:
             translated = get_translation(translations, key)
             if translated:
-                html = html.replace(eng_text, translated)
+                replace(eng_text, translated)
 
         # Compare callout button
         cta = get_translation(translations, "index.compare_callout_btn")
         if cta:
-            html = html.replace('Compare commute options &rarr;', cta.replace("→", "&rarr;"))
+            replace('Compare commute options &rarr;', cta.replace("→", "&rarr;"))
 
         # Stat "4 weeks" and "Feb 15 – Mar 15"
         stat_weeks = get_translation(translations, "index.stat_4_weeks")
         stat_dates = get_translation(translations, "index.stat_dates")
         if stat_weeks:
-            html = html.replace('>4 weeks<', f'>{stat_weeks}<')
+            replace('>4 weeks<', f'>{stat_weeks}<')
         if stat_dates:
-            html = html.replace('>Feb 15 &ndash; Mar 15<', f'>{stat_dates}<')
+            replace('>Feb 15 &ndash; Mar 15<', f'>{stat_dates}<')
 
         # Line badge default
         line_badge = get_translation(translations, "index.line_badge_default")
         if line_badge:
-            html = html.replace('>Select a line</div>', f'>{line_badge}</div>')
+            replace('>Select a line</div>', f'>{line_badge}</div>')
 
         # Route planner panel intro
         rp_title = get_translation(translations, "index.route_planner_title")
         rp_empty = get_translation(translations, "index.route_planner_empty")
         if rp_title:
-            html = html.replace(
+            replace(
                 '<h2>Route planner</h2>',
                 f'<h2>{rp_title}</h2>'
             )
         if rp_empty:
-            html = html.replace(
+            replace(
                 'Select a line above to see your options during the cutover.',
                 rp_empty
             )
@@ -540,18 +1089,18 @@ def replace_page_specific_content(html, translations, page_key):
         tg_title = get_translation(translations, "index.ticket_guide_title")
         tg_empty = get_translation(translations, "index.ticket_guide_empty")
         if tg_title:
-            html = html.replace(
+            replace(
                 '<h2>What ticket should I buy?</h2>',
                 f'<h2>{tg_title}</h2>'
             )
         if tg_empty:
-            html = html.replace(
+            replace(
                 'Select a line above to see ticket guidance for the cutover period.',
                 tg_empty
             )
 
         # Terminal map labels
-        for key, eng_text in [
+        replace_wrapped([
             ("index.terminal_hudson_river", "Hudson River"),
             ("index.terminal_ferry_dock", "Ferry dock"),
             ("index.terminal_ferry_detail", "NY Waterway to W. 39th St"),
@@ -563,15 +1112,12 @@ def replace_page_specific_content(html, translations, page_key):
             ("index.terminal_path_entrance", "PATH entrance"),
             ("index.terminal_path_detail", "Downstairs from concourse"),
             ("index.terminal_bus_area", "Bus area"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
 
         # Bus detail has middot entity
         bus_detail = get_translation(translations, "index.terminal_bus_detail")
         if bus_detail:
-            html = html.replace(
+            replace(
                 ">Bus 126 to Port Authority &middot; Hudson Place<",
                 f">{bus_detail.replace('·', '&middot;')}<"
             )
@@ -585,48 +1131,24 @@ def replace_page_specific_content(html, translations, page_key):
             title = get_translation(translations, f"{prefix}_title")
             time = get_translation(translations, f"{prefix}_time")
             if title:
-                html = html.replace(f"<h4>{eng_title}</h4>", f"<h4>{title}</h4>")
+                replace(f"<h4>{eng_title}</h4>", f"<h4>{title}</h4>")
             if time:
-                html = html.replace(f'<span class="transfer-time">{eng_time}</span>',
-                                    f'<span class="transfer-time">{time}</span>')
+                replace(f'<span class="transfer-time">{eng_time}</span>',
+                        f'<span class="transfer-time">{time}</span>')
             for i in range(1, 6):
                 step = get_translation(translations, f"{prefix}_step{i}")
                 if step:
-                    # Find the English step text from en.json to replace
-                    eng_steps = {
-                        "index.path_step1": "Exit your train and walk toward the main terminal building",
-                        "index.path_step2": "Enter the historic waiting room / main concourse",
-                        "index.path_step3": 'Look for PATH signs — the entrance is <strong>downstairs</strong>',
-                        "index.path_step4": "Take escalator/stairs down to PATH platform level",
-                        "index.path_step5": "Board the Hoboken &rarr; 33rd Street train",
-                        "index.ferry_step1": "Exit your train and walk through the terminal building",
-                        "index.ferry_step2": 'Exit on the <strong>waterfront side</strong> (east side, toward the river)',
-                        "index.ferry_step3": "The ferry dock is along the waterfront walkway to the right",
-                        "index.ferry_step4": "Look for NY Waterway signage and the boarding area",
-                        "index.ferry_step5": "Board the ferry to W. 39th St, Midtown",
-                        "index.bus_step1": "Exit your train and walk through the terminal building",
-                        "index.bus_step2": 'Exit on the <strong>street side</strong> (west side, away from the river)',
-                        "index.bus_step3": 'The bus stops are on <strong>Hudson Place</strong>, the street in front of the terminal',
-                        "index.bus_step4": "Look for Bus 126 signage or ask NJ Transit staff",
-                        "index.bus_step5": "Board Bus 126 to Port Authority Bus Terminal",
-                    }
-                    eng_step = eng_steps.get(f"{prefix}_step{i}")
+                    eng_step = ENG_STEPS.get(f"{prefix}_step{i}")
                     if eng_step:
                         # Handle → entity in path_step5
-                        eng_html = eng_step.replace("→", "&rarr;")
                         step_html = step.replace("→", "&rarr;")
-                        html = html.replace(f"<li>{eng_html}</li>", f"<li>{step_html}</li>")
+                        replace(f"<li>{eng_step}</li>", f"<li>{step_html}</li>")
 
             tip = get_translation(translations, f"{prefix}_tip")
             if tip:
-                eng_tips = {
-                    "index.path_tip": "NJ Transit staff will be deployed throughout the terminal. Follow the crowds — most people will be heading to PATH.",
-                    "index.ferry_tip": "Check the NY Waterway app for next departure time before leaving the terminal. Ferries run less frequently than PATH.",
-                    "index.bus_tip": "Bus 126 goes through the Lincoln Tunnel. During peak hours, allow extra time for tunnel traffic.",
-                }
-                eng_tip = eng_tips.get(f"{prefix}_tip")
+                eng_tip = ENG_TIPS.get(f"{prefix}_tip")
                 if eng_tip:
-                    html = html.replace(
+                    replace(
                         f'<p class="transfer-tip">{eng_tip}</p>',
                         f'<p class="transfer-tip">{tip}</p>'
                     )
@@ -634,110 +1156,53 @@ def replace_page_specific_content(html, translations, page_key):
         # Secaucus section
         secaucus_intro = get_translation(translations, "index.secaucus_intro")
         if secaucus_intro:
-            html = html.replace(
-                "During the cutover, only one track operates between Newark Penn Station and Secaucus Junction. This is the bottleneck that causes the 50% service reduction. Even if you don&#x27;t transfer at Secaucus, delays here ripple across the entire system.",
-                secaucus_intro
-            )
-            # Also try without HTML entity
-            html = html.replace(
+            replace_apostrophes(
                 "During the cutover, only one track operates between Newark Penn Station and Secaucus Junction. This is the bottleneck that causes the 50% service reduction. Even if you don't transfer at Secaucus, delays here ripple across the entire system.",
                 secaucus_intro
             )
 
         # Secaucus card headings
-        for key, eng_text in [
+        replace_wrapped([
             ("index.secaucus_transfer_title", "If you transfer at Secaucus"),
             ("index.secaucus_avoid_title", "Avoiding Secaucus entirely"),
             ("index.secaucus_delays_title", "Delay expectations"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h4>{eng_text}</h4>", f"<h4>{translated}</h4>")
-
-        # Secaucus list items
-        secaucus_items = {
-            "index.secaucus_transfer_item1": '<strong>Allow extra time.</strong> Connections that normally take 5–10 minutes may take 15–25 minutes due to single-track delays.',
-            "index.secaucus_transfer_item2": '<strong>Fewer trains means fewer connections.</strong> Check the temporary schedule for your specific connection — some may be eliminated.',
-            "index.secaucus_transfer_item3": '<strong>Follow the signs.</strong> NJ Transit is deploying extra staff at Secaucus to help with wayfinding and crowd management.',
-            "index.secaucus_transfer_item4": '<strong>Have a backup plan.</strong> If you miss a connection, know your next option (next train, or bus alternative).',
-            "index.secaucus_avoid_item1": '<strong>Hoboken-diverted lines (M-B, M&amp;E, Gladstone):</strong> Your trains go to Hoboken, not through Secaucus. The bottleneck doesn\'t directly affect you.',
-            "index.secaucus_avoid_item2": '<strong>Consider Hoboken as your hub.</strong> If you can get to a Morris &amp; Essex or Montclair-Boonton station, routing through Hoboken may be faster than fighting through Secaucus.',
-            "index.secaucus_avoid_item3": '<strong>Bus alternatives:</strong> NJ Transit buses that go directly to Port Authority skip Secaucus entirely.',
-            "index.secaucus_avoid_item4": '<strong>Drive to Newark Penn:</strong> If you normally drive to a station, consider driving directly to Newark Penn Station for a more direct NEC train to PSNY.',
-            "index.secaucus_delays_item1": '<strong>Peak hours (7–9am, 5–7pm):</strong> Delays of 15–30+ minutes are likely at Secaucus due to single-track operations.',
-            "index.secaucus_delays_item2": '<strong>Off-peak:</strong> Delays should be shorter but still expect 5–15 minutes of added travel time.',
-            "index.secaucus_delays_item3": '<strong>Cascading delays:</strong> A delay on one line backs up all lines sharing the single track. One late train affects everything behind it.',
-            "index.secaucus_delays_item4": '<strong>Check real-time status:</strong> Use the NJ Transit app or <a href="https://www.njtransit.com/travel-alerts-to" target="_blank" rel="noopener">njtransit.com travel alerts</a> before leaving home.',
-        }
-        for key, eng_text in secaucus_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                # Escape & to &amp; in translated text for HTML context
-                trans_html = translated.replace("&", "&amp;").replace("&amp;lt;", "&lt;").replace("&amp;gt;", "&gt;")
-                # But preserve HTML tags - undo escaping inside tags
-                trans_html = re.sub(r'&amp;(#?\w+;)', r'&\1', trans_html)
-                # Actually, just use the raw translation which already has proper HTML
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        ], "<h4>", "</h4>")
+
+        # Secaucus list items (translations already carry their own HTML and entities)
+        replace_wrapped(INDEX_SECAUCUS_ITEMS.items(), "<li>", "</li>")
 
         # Timeline events
-        tl_events = [
-            ("index.tl_announce_title", "Cutover announced",
-             "index.tl_announce_desc", "NJ Transit and Amtrak announce the Portal North Bridge cutover schedule and temporary service changes."),
-            ("index.tl_tickets_title", "New ticket rules begin",
-             "index.tl_tickets_desc", "Midtown Direct riders should start buying Hoboken monthly passes (valid for Penn Station travel Feb 1–15)."),
-            ("index.tl_start_title", "Phase 1 begins",
-             "index.tl_start_desc", "Temporary schedules take effect. Midtown Direct weekday trains diverted to Hoboken. Single-track operation between Newark and Secaucus."),
-            ("index.tl_end_title", "Phase 1 complete",
-             "index.tl_end_desc", "Regular NJ Transit schedules resumed. First track on the new Portal North Bridge enters passenger service March 16."),
-            ("index.tl_phase2_title", "Phase 2",
-             "index.tl_phase2_desc", "Second track cutover. Similar service disruptions expected. Dates TBA. After this, the old Portal Bridge is permanently retired."),
-        ]
-        for title_key, eng_title, desc_key, eng_desc in tl_events:
+        for title_key, eng_title, desc_key, eng_desc in INDEX_TL_EVENTS:
             title = get_translation(translations, title_key)
             desc = get_translation(translations, desc_key)
             if title:
-                html = html.replace(f"<h4>{eng_title}</h4>", f"<h4>{title}</h4>")
+                replace(f"<h4>{eng_title}</h4>", f"<h4>{title}</h4>")
             if desc:
-                html = html.replace(f"<p>{eng_desc}</p>", f"<p>{desc}</p>")
+                replace(f"<p>{eng_desc}</p>", f"<p>{desc}</p>")
 
         # Resource links
-        res_links = [
-            ("index.res_cutover_title", "NJ Transit cutover page",
-             "index.res_cutover_desc", "Official schedules, maps, and FAQs"),
-            ("index.res_schedules_title", "Temporary train schedules",
-             "index.res_schedules_desc", "Line-by-line PDF schedules for Feb 15 – Mar 15"),
-            ("index.res_alerts_title", "Real-time travel alerts",
-             "index.res_alerts_desc", "Live service status and delay notifications"),
-            ("index.res_path_title", "PATH train schedules",
-             "index.res_path_desc", "Hoboken – 33rd Street service info"),
-            ("index.res_ferry_title", "NY Waterway ferries",
-             "index.res_ferry_desc", "Hoboken – Midtown ferry schedules"),
-        ]
-        for title_key, eng_title, desc_key, eng_desc in res_links:
+        for title_key, eng_title, desc_key, eng_desc in INDEX_RES_LINKS:
             title = get_translation(translations, title_key)
             desc = get_translation(translations, desc_key)
             if title:
-                html = html.replace(f"<strong>{eng_title}</strong>", f"<strong>{title}</strong>")
+                replace(f"<strong>{eng_title}</strong>", f"<strong>{title}</strong>")
             if desc:
-                html = html.replace(f"<span>{eng_desc}</span>", f"<span>{desc}</span>")
+                replace(f"<span>{eng_desc}</span>", f"<span>{desc}</span>")
 
     elif page_key == "compare":
         # Phase banner injection
         phase_banner = get_translation(translations, "common.phase_banner")
         if phase_banner:
-            html = html.replace(
+            replace(
                 '<main class="container" id="main-content">',
                 f'<main class="container" id="main-content">\n    <div class="phase-banner">{phase_banner}</div>'
             )
 
         # Hero section
-        for key, eng_text in [
+        replace_wrapped([
             ("compare.hero_title", "How does your commute change?"),
             ("compare.hero_desc", "Pick your station and Manhattan destination. We'll show you every option side by side with visual time breakdowns."),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
 
         # Step labels (pattern: </span> Text</div>)
         for key, eng_text in [
@@ -748,16 +1213,16 @@ def replace_page_specific_content(html, translations, page_key):
             translated = get_translation(translations, key)
             if translated:
                 # Step 2 uses <label> instead of <div>, handle both
-                html = html.replace(f"</span> {eng_text}</div>", f"</span> {translated}</div>")
-                html = html.replace(f"</span> {eng_text}</label>", f"</span> {translated}</label>")
+                replace(f"</span> {eng_text}</div>", f"</span> {translated}</div>")
+                replace(f"</span> {eng_text}</label>", f"</span> {translated}</label>")
 
         # Station placeholder
         choose = get_translation(translations, "index.choose_station")
         if choose:
-            html = html.replace('Choose your station&hellip;', choose)
+            replace('Choose your station&hellip;', choose)
 
     elif page_key == "coverage":
-        for key, eng_text in [
+        replace_wrapped([
             ("coverage.hero_title", "Portal Bridge in the news"),
             ("coverage.hero_desc", "Curated coverage of the cutover from local and regional news sources."),
             ("coverage.all_sources", "All sources"),
@@ -770,72 +1235,56 @@ def replace_page_specific_content(html, translations, page_key):
             ("coverage.direction_label", "Direction"),
             ("coverage.sort_label", "Sort"),
             ("coverage.search_label", "Search"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
         # Search placeholder (HTML uses &hellip; entity, match both forms)
         search_ph = get_translation(translations, "coverage.search_placeholder")
         if search_ph:
-            html = html.replace('placeholder="Search articles&hellip;"', f'placeholder="{search_ph}"')
-            html = html.replace('placeholder="Search articles…"', f'placeholder="{search_ph}"')
+            replace('placeholder="Search articles&hellip;"', f'placeholder="{search_ph}"')
+            replace('placeholder="Search articles…"', f'placeholder="{search_ph}"')
 
-        # Category options
-        for key, eng_text in [
+        # Category options: value stays in English, option text gets translated
+        replace_wrapped([
             ("coverage.cat_news", "News"),
             ("coverage.cat_opinion", "Opinion"),
             ("coverage.cat_analysis", "Analysis"),
             ("coverage.cat_official", "Official"),
             ("coverage.cat_community", "Community"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                # Match option elements: value stays in English, text gets translated
-                html = html.replace(f">{eng_text}</option>", f">{translated}</option>")
+        ], ">", "</option>")
 
         # Direction options
-        for key, eng_text in [
+        replace_wrapped([
             ("coverage.dir_nj_nyc", "NJ to NYC"),
             ("coverage.dir_nyc_nj", "NYC to NJ"),
             ("coverage.dir_both", "Both directions"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}</option>", f">{translated}</option>")
+        ], ">", "</option>")
 
         # Sort options
-        for key, eng_text in [
+        replace_wrapped([
             ("coverage.sort_newest", "Newest first"),
             ("coverage.sort_relevance", "Most relevant"),
             ("coverage.sort_oldest", "Oldest first"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}</option>", f">{translated}</option>")
+        ], ">", "</option>")
 
     elif page_key == "map":
         # Phase banner injection
         phase_banner = get_translation(translations, "common.phase_banner")
         if phase_banner:
-            html = html.replace(
+            replace(
                 '<main class="container" id="main-content">',
                 f'<main class="container" id="main-content">\n    <div class="phase-banner">{phase_banner}</div>'
             )
 
-        for key, eng_text in [
+        replace_wrapped([
             ("map.hero_title", "Portal Bridge cutover map"),
             ("map.hero_desc", "See the geography of the cutover: the Portal Bridge location, affected stations, key transfer hubs, and alternative routes."),
             ("map.filter_all", "All"),
             ("map.filter_transfer_hubs", "Transfer hubs"),
             ("map.legend_title", "Legend"),
             ("map.about_title", "About the Portal Bridge"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
         about_desc = get_translation(translations, "map.about_desc")
         if about_desc:
-            html = html.replace(
+            replace(
                 "The Portal Bridge spans the Hackensack River in Kearny, NJ, between Newark and Secaucus. It is the single most critical piece of infrastructure on the Northeast Corridor between New York and Washington, D.C.",
                 about_desc
             )
@@ -844,67 +1293,47 @@ def replace_page_specific_content(html, translations, page_key):
         legend_portal = get_translation(translations, "map.legend_portal_bridge")
         legend_hub = get_translation(translations, "map.legend_transfer_hub")
         if legend_portal:
-            html = html.replace(
+            replace(
                 '></span> Portal Bridge</div>',
                 f'></span> {legend_portal}</div>'
             )
         if legend_hub:
-            html = html.replace(
+            replace(
                 '></span> Transfer hub</div>',
                 f'></span> {legend_hub}</div>'
             )
 
         # Bridge info cards
-        for key, eng_text in [
+        replace_wrapped([
             ("map.old_bridge_title", "The old bridge"),
             ("map.new_bridge_title", "The new bridge"),
             ("map.cutover_title", "The cutover"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h4>{eng_text}</h4>", f"<h4>{translated}</h4>")
+        ], "<h4>", "</h4>")
 
         # Bridge card list items
-        bridge_items = {
-            "map.old_bridge_item1": 'Built in <strong>1910</strong> &mdash; 115 years old',
-            "map.old_bridge_item2": 'Swing bridge design that opens for marine traffic',
-            "map.old_bridge_item3": 'Frequently gets stuck, causing hours of delay',
-            "map.old_bridge_item4": 'Carries every NJ Transit and Amtrak train on the Northeast Corridor',
-            "map.new_bridge_item1": 'Portal North Bridge: $1.5 billion replacement',
-            "map.new_bridge_item2": 'Fixed-span design &mdash; never opens, never gets stuck',
-            "map.new_bridge_item3": '50 feet higher than the old bridge, allowing boats to pass underneath',
-            "map.new_bridge_item4": 'Part of the larger Gateway Program to modernize the corridor',
-            "map.cutover_item1": '<strong>Phase 1</strong> (Feb 15 &ndash; Mar 15, 2026): First track transferred to new bridge',
-            "map.cutover_item2": 'Requires single-track operations between Newark and Secaucus',
-            "map.cutover_item3": '50% service reduction across all lines',
-            "map.cutover_item4": '<strong>Phase 2</strong> (Fall 2026): Second track transferred, old bridge retired',
-        }
-        for key, eng_text in bridge_items.items():
+        for key, eng_text in MAP_BRIDGE_ITEMS.items():
             translated = get_translation(translations, key)
             if translated:
                 # Convert translation dashes to HTML entities to match source
                 trans_html = translated.replace("—", "&mdash;").replace("–", "&ndash;")
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{trans_html}</li>")
+                replace(f"<li>{eng_text}</li>", f"<li>{trans_html}</li>")
 
     elif page_key == "embed":
         # SEO summary
         seo_summary = get_translation(translations, "embed.seo_summary")
         if seo_summary:
-            html = html.replace(
+            replace(
                 "Embed Reroute NJ tools on your website for free. Newsrooms, publishers, and community organizations can iframe any tool, link directly, or fork the open-source code to create a branded version.",
                 seo_summary
             )
 
         # Hero
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.hero_title", "Put Reroute NJ on your website"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
+        ], ">", "<")
         hero_desc = get_translation(translations, "embed.hero_desc")
         if hero_desc:
-            html = html.replace(
+            replace(
                 "Reroute NJ is free, open source, and built for the community. Pick an embed type, configure it, and grab the code.",
                 hero_desc
             )
@@ -922,47 +1351,32 @@ def replace_page_specific_content(html, translations, page_key):
             translated = get_translation(translations, key)
             if translated:
                 escaped = translated.replace("&", "&amp;")
-                html = html.replace(f">{eng_text}<", f">{escaped}<")
+                replace(f">{eng_text}<", f">{escaped}<")
 
         # Configurator type cards
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.cfg_type_card", "Info card"),
             ("embed.cfg_type_widget", "Interactive widget"),
             ("embed.cfg_type_tool", "Full tool"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(
-                    f'<strong class="cfg-type-name">{eng_text}</strong>',
-                    f'<strong class="cfg-type-name">{translated}</strong>'
-                )
-        for key, eng_text in [
+        ], '<strong class="cfg-type-name">', '</strong>')
+        replace_wrapped([
             ("embed.cfg_type_card_desc", "A compact card with key facts about a line or station. Great for newsletters, social media, and article sidebars."),
             ("embed.cfg_type_widget_desc", "A mini version of our tools your readers can use inline. Works in any CMS that supports HTML blocks."),
             ("embed.cfg_type_tool_desc", "The complete tool experience, embedded on your page. All features, fully interactive."),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(
-                    f'<span class="cfg-type-desc">{eng_text}</span>',
-                    f'<span class="cfg-type-desc">{translated}</span>'
-                )
+        ], '<span class="cfg-type-desc">', '</span>')
 
         # Step 2: Configure form labels
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.cfg_card_type_label", "Card type"),
             ("embed.cfg_tool_label", "Tool"),
             ("embed.cfg_line_label", "Line"),
             ("embed.cfg_station_label", "Station"),
             ("embed.cfg_theme_label", "Theme"),
             ("embed.cfg_accent_label", "Accent color"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}</label>", f">{translated}</label>")
+        ], ">", "</label>")
 
         # Step 2: Select options
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.cfg_card_type_line", "Line overview"),
             ("embed.cfg_card_type_station", "Station info"),
             ("embed.cfg_card_type_summary", "Cutover summary"),
@@ -972,207 +1386,140 @@ def replace_page_specific_content(html, translations, page_key):
             ("embed.cfg_tool_map", "Interactive map"),
             ("embed.cfg_theme_light", "Light"),
             ("embed.cfg_theme_dark", "Dark"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}</option>", f">{translated}</option>")
+        ], ">", "</option>")
 
         # Select placeholders with HTML entities
         line_ph = get_translation(translations, "embed.cfg_line_placeholder")
         if line_ph:
-            html = html.replace('Select a line&hellip;', line_ph)
+            replace('Select a line&hellip;', line_ph)
         station_ph = get_translation(translations, "embed.cfg_station_placeholder")
         if station_ph:
-            html = html.replace('Select a station&hellip;', station_ph)
+            replace('Select a station&hellip;', station_ph)
 
         # Step 3: Preview and output
         preview_label = get_translation(translations, "embed.cfg_preview_label")
         if preview_label:
-            html = html.replace(
+            replace(
                 '<div class="cfg-preview-label">Live preview</div>',
                 f'<div class="cfg-preview-label">{preview_label}</div>'
             )
 
         # Output tabs
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.cfg_tab_iframe", "Iframe"),
             ("embed.cfg_tab_script", "Script tag"),
             ("embed.cfg_tab_png", "Download PNG"),
             ("embed.cfg_tab_html", "Download HTML"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f">{eng_text}</button>", f">{translated}</button>")
+        ], ">", "</button>")
 
         # Copy/download buttons and messages
         copy_btn = get_translation(translations, "embed.cfg_copy_btn")
         if copy_btn:
-            html = html.replace('>Copy code</button>', f'>{copy_btn}</button>')
+            replace('>Copy code</button>', f'>{copy_btn}</button>')
         copied = get_translation(translations, "embed.cfg_copied")
         if copied:
-            html = html.replace('>Copied!</span>', f'>{copied}</span>')
+            replace('>Copied!</span>', f'>{copied}</span>')
 
         png_msg = get_translation(translations, "embed.cfg_png_msg")
         if png_msg:
-            html = html.replace(
+            replace(
                 "Click the button below to export the info card as a PNG image.",
                 png_msg
             )
         dl_png = get_translation(translations, "embed.cfg_download_png")
         if dl_png:
-            html = html.replace('>Download PNG</button>', f'>{dl_png}</button>')
+            replace('>Download PNG</button>', f'>{dl_png}</button>')
 
         html_msg = get_translation(translations, "embed.cfg_html_msg")
         if html_msg:
-            html = html.replace(
+            replace(
                 "Click the button below to download a self-contained HTML file of the info card.",
                 html_msg
             )
         dl_html = get_translation(translations, "embed.cfg_download_html")
         if dl_html:
-            html = html.replace('>Download HTML</button>', f'>{dl_html}</button>')
+            replace('>Download HTML</button>', f'>{dl_html}</button>')
 
         # Section intro texts
         dl_intro = get_translation(translations, "embed.direct_links_intro")
         if dl_intro:
-            html = html.replace(
+            replace(
                 "Link directly to any tool. These URLs are permanent and shareable.",
                 dl_intro
             )
 
         # Direct link labels in <strong> within resource-link divs
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.link_line_guide", "Line guide"),
             ("embed.link_compare", "Commute comparison"),
             ("embed.link_coverage", "News coverage"),
             ("embed.link_map", "Interactive map"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(
-                    f'<strong>{eng_text}</strong>\n          <span class="embed-url">',
-                    f'<strong>{translated}</strong>\n          <span class="embed-url">'
-                )
+        ], "<strong>", '</strong>\n          <span class="embed-url">')
 
         # Publishers section
         pub_intro = get_translation(translations, "embed.publishers_intro")
         if pub_intro:
-            html = html.replace(
+            replace(
                 "Reroute NJ is designed for journalists, newsrooms, and community publishers.",
                 pub_intro
             )
 
         # Publisher card headings
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.pub_embed_title", "Embed in your articles"),
             ("embed.pub_link_title", "Link from your coverage"),
             ("embed.pub_contribute_title", "Contribute coverage"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h4>{eng_text}</h4>", f"<h4>{translated}</h4>")
+        ], "<h4>", "</h4>")
 
         # Publisher card items
-        pub_items = {
-            "embed.pub_embed_item1": "Use the configurator above to generate embed code for any format.",
-            "embed.pub_embed_item2": 'Paste into your CMS (WordPress, Ghost, Squarespace, etc.) &mdash; most support raw HTML blocks.',
-            "embed.pub_embed_item3": "The embeds are responsive and work on mobile.",
-            "embed.pub_embed_item4": "No API key or account needed.",
-            "embed.pub_link_item1": 'Add a "Plan your commute" link box to your Portal Bridge stories.',
-            "embed.pub_link_item2": "Link to specific tools based on what the article covers.",
-            "embed.pub_link_item3": "OG images and social cards are already set up for clean previews.",
-            "embed.pub_link_item4": 'Suggested anchor text: "Use the free Reroute NJ tool to plan your commute."',
-            "embed.pub_contribute_item1": 'We curate Portal Bridge coverage on our <a href="coverage.html">news coverage page</a>.',
-            "embed.pub_contribute_item2": 'To suggest an article, <a href="https://github.com/jamditis/reroute-nj/issues/new?template=article-suggestion.md" target="_blank" rel="noopener">open a GitHub issue</a>.',
-            "embed.pub_contribute_item3": 'Or email <strong><a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a></strong> with "Reroute NJ coverage" in the subject.',
-            "embed.pub_contribute_item4": "We include all relevant coverage &mdash; opinion, analysis, community reporting, and more.",
-        }
-        for key, eng_text in pub_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(EMBED_PUB_ITEMS.items(), "<li>", "</li>")
 
         # Co-branding section
         brand_intro = get_translation(translations, "embed.branding_intro")
         if brand_intro:
-            html = html.replace(
+            replace_apostrophes(
                 "Want to run Reroute NJ with your own branding? Since it's open source, you can.",
                 brand_intro
             )
-            html = html.replace(
-                "Want to run Reroute NJ with your own branding? Since it&#x27;s open source, you can.",
-                brand_intro
-            )
 
         # Fork section heading
         fork_title = get_translation(translations, "embed.fork_title")
         if fork_title:
-            html = html.replace("<h3>Fork the project</h3>", f"<h3>{fork_title}</h3>")
+            replace("<h3>Fork the project</h3>", f"<h3>{fork_title}</h3>")
 
         # Fork steps
-        fork_steps = {
-            "embed.fork_step1": 'Fork the <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">GitHub repository</a> to your organization\'s account.',
-            "embed.fork_step2": 'Edit <code>css/styles.css</code> to change colors, fonts, and branding. All theme values are CSS custom properties in the <code>:root</code> block.',
-            "embed.fork_step3": 'Replace the brand name, logo, and footer credit with your own.',
-            "embed.fork_step4": 'Deploy to GitHub Pages, Netlify, Vercel, or your own server. No build step required.',
-        }
-        for key, eng_text in fork_steps.items():
+        for key, eng_text in EMBED_FORK_STEPS.items():
             translated = get_translation(translations, key)
             if translated:
-                html = html.replace(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
-                eng_entity = eng_text.replace("'", "&#x27;")
-                html = html.replace(f"<p>{eng_entity}</p>", f"<p>{translated}</p>")
+                replace_apostrophes(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
 
         # Contribute section
         contribute_intro = get_translation(translations, "embed.contribute_intro")
         if contribute_intro:
-            html = html.replace(
+            replace_apostrophes(
                 "Reroute NJ is a community project. Here's how you can help.",
                 contribute_intro
             )
-            html = html.replace(
-                "Reroute NJ is a community project. Here&#x27;s how you can help.",
-                contribute_intro
-            )
 
         # Contribute card headings
-        for key, eng_text in [
+        replace_wrapped([
             ("embed.nontechnical_title", "Non-technical contributions"),
             ("embed.technical_title", "Technical contributions"),
             ("embed.license_title", "License"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h4>{eng_text}</h4>", f"<h4>{translated}</h4>")
+        ], "<h4>", "</h4>")
 
         # Contribute card items
-        contribute_items = {
-            "embed.nontechnical_item1": '<strong>Submit article suggestions:</strong> Know of a Portal Bridge article we missed? <a href="https://github.com/jamditis/reroute-nj/issues/new?template=article-suggestion.md" target="_blank" rel="noopener">Open an issue</a> or email joe@amditis.com.',
-            "embed.nontechnical_item2": '<strong>Report inaccuracies:</strong> If schedule data or transfer times are wrong, let us know.',
-            "embed.nontechnical_item3": '<strong>Share the tool:</strong> Tell your commuter friends, share on social media, post in your neighborhood group.',
-            "embed.technical_item1": '<strong>File bugs:</strong> Found a bug? <a href="https://github.com/jamditis/reroute-nj/issues" target="_blank" rel="noopener">Open an issue on GitHub</a>.',
-            "embed.technical_item2": '<strong>Submit a pull request:</strong> The codebase is vanilla HTML/CSS/JS with no build step. Fork, change, PR.',
-            "embed.technical_item3": '<strong>Add data:</strong> Help us keep <code>data/coverage.json</code> up to date with new articles.',
-            "embed.technical_item4": '<strong>Improve accessibility:</strong> Screen reader testing, WCAG compliance, keyboard navigation.',
-            "embed.license_item1": 'Reroute NJ is released under the <strong>MIT License</strong>.',
-            "embed.license_item2": 'You can use, copy, modify, and distribute it freely.',
-            "embed.license_item3": 'Attribution is appreciated but not required.',
-            "embed.license_item4": 'The project is maintained by <a href="https://github.com/jamditis" target="_blank" rel="noopener">Joe Amditis</a>.',
-        }
-        for key, eng_text in contribute_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(EMBED_CONTRIBUTE_ITEMS.items(), "<li>", "</li>")
 
     elif page_key == "blog":
         # Blog index page
         heading = get_translation(translations, "blog.heading")
         if heading:
-            html = html.replace(">Blog</h1>", f">{heading}</h1>")
+            replace(">Blog</h1>", f">{heading}</h1>")
 
         index_tagline = get_translation(translations, "blog.index_tagline")
         if index_tagline:
-            html = html.replace(
+            replace(
                 ">Updates and stories from the Reroute NJ project</p>",
                 f">{index_tagline}</p>"
             )
@@ -1180,26 +1527,22 @@ def replace_page_specific_content(html, translations, page_key):
         # Post card
         post1_title = get_translation(translations, "blog.post1_title")
         if post1_title:
-            html = html.replace(">Why we built Reroute NJ</h2>", f">{post1_title}</h2>")
+            replace(">Why we built Reroute NJ</h2>", f">{post1_title}</h2>")
 
         post1_date = get_translation(translations, "blog.post1_date")
         if post1_date:
-            html = html.replace(">February 12, 2026</time>", f">{post1_date}</time>")
+            replace(">February 12, 2026</time>", f">{post1_date}</time>")
 
         post1_excerpt = get_translation(translations, "blog.post1_excerpt")
         if post1_excerpt:
-            html = html.replace(
-                '>Five free tools in 11 languages to help NJ Transit riders navigate the Portal Bridge cutover. Here&#x27;s why we built it and how you can help.</p>',
-                f'>{post1_excerpt}</p>'
-            )
-            html = html.replace(
+            replace_apostrophes(
                 ">Five free tools in 11 languages to help NJ Transit riders navigate the Portal Bridge cutover. Here's why we built it and how you can help.</p>",
                 f'>{post1_excerpt}</p>'
             )
 
         read_more = get_translation(translations, "blog.read_more")
         if read_more:
-            html = html.replace(
+            replace(
                 '>Read more &rarr;</span>',
                 f'>{read_more.replace("→", "&rarr;")}</span>'
             )
@@ -1207,19 +1550,19 @@ def replace_page_specific_content(html, translations, page_key):
         # Post 2 card (embed system post)
         post2_title = get_translation(translations, "blog.post2_title")
         if post2_title:
-            html = html.replace(">New: Embed Reroute NJ on your website</h2>", f">{post2_title}</h2>")
+            replace(">New: Embed Reroute NJ on your website</h2>", f">{post2_title}</h2>")
 
         post2_date = get_translation(translations, "blog.post2_date")
         if post2_date:
-            html = html.replace(">February 13, 2026</time>", f">{post2_date}</time>")
+            replace(">February 13, 2026</time>", f">{post2_date}</time>")
 
         post2_excerpt = get_translation(translations, "blog.post2_excerpt")
         if post2_excerpt:
-            html = html.replace(
+            replace(
                 ">Newsrooms and publishers can now embed Reroute NJ tools directly on their websites. Four embed formats, a visual configurator, and PNG export — all free.</p>",
                 f'>{post2_excerpt}</p>'
             )
-            html = html.replace(
+            replace(
                 ">Newsrooms and publishers can now embed Reroute NJ tools directly on their websites. Four embed formats, a visual configurator, and PNG export &#x2014; all free.</p>",
                 f'>{post2_excerpt}</p>'
             )
@@ -1227,90 +1570,77 @@ def replace_page_specific_content(html, translations, page_key):
         # Post 3 card (cutover begins post)
         post3_title = get_translation(translations, "blog.post3_title")
         if post3_title:
-            html = html.replace(">The cutover starts today</h2>", f">{post3_title}</h2>")
+            replace(">The cutover starts today</h2>", f">{post3_title}</h2>")
 
         post3_date = get_translation(translations, "blog.post3_date")
         if post3_date:
-            html = html.replace(">February 15, 2026</time>", f">{post3_date}</time>")
+            replace(">February 15, 2026</time>", f">{post3_date}</time>")
 
         post3_excerpt = get_translation(translations, "blog.post3_excerpt")
         if post3_excerpt:
-            html = html.replace(
+            replace_apostrophes(
                 ">The Portal North Bridge cutover starts today. Here's what NJ Transit riders need to know and how Reroute NJ can help for the next four weeks.</p>",
                 f'>{post3_excerpt}</p>'
             )
-            html = html.replace(
-                ">The Portal North Bridge cutover starts today. Here&#x27;s what NJ Transit riders need to know and how Reroute NJ can help for the next four weeks.</p>",
-                f'>{post3_excerpt}</p>'
-            )
 
         # Post 4 card (bridge opens post)
         post4_title = get_translation(translations, "blog.post4_title")
         if post4_title:
-            html = html.replace(">The new Portal North Bridge is open</h2>", f">{post4_title}</h2>")
+            replace(">The new Portal North Bridge is open</h2>", f">{post4_title}</h2>")
 
         post4_date = get_translation(translations, "blog.post4_date")
         if post4_date:
-            html = html.replace(">March 13, 2026</time>", f">{post4_date}</time>")
+            replace(">March 13, 2026</time>", f">{post4_date}</time>")
 
         post4_excerpt = get_translation(translations, "blog.post4_excerpt")
         if post4_excerpt:
-            html = html.replace(
+            replace_apostrophes(
                 ">Phase 1 is complete. Regular NJ Transit schedules resume March 15 and the first track on the new bridge enters service March 16. Here's what it means for riders.</p>",
                 f'>{post4_excerpt}</p>'
             )
-            html = html.replace(
-                ">Phase 1 is complete. Regular NJ Transit schedules resume March 15 and the first track on the new bridge enters service March 16. Here&#x27;s what it means for riders.</p>",
-                f'>{post4_excerpt}</p>'
-            )
 
     elif page_key == "blog_post":
         # Blog post: "Why we built Reroute NJ"
         # Back/footer nav links
         all_posts = get_translation(translations, "blog.all_posts")
         if all_posts:
-            html = html.replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
+            replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
         back_all = get_translation(translations, "blog.back_to_all_posts")
         if back_all:
-            html = html.replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
+            replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
 
         heading = get_translation(translations, "blog_post.heading")
         if heading:
-            html = html.replace(">Why we built Reroute NJ</h1>", f">{heading}</h1>")
+            replace(">Why we built Reroute NJ</h1>", f">{heading}</h1>")
 
         # Author prefix
         by_prefix = get_translation(translations, "blog_post.by_prefix")
         if by_prefix:
-            html = html.replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
+            replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
 
         # Date
         date = get_translation(translations, "blog_post.date")
         if date:
-            html = html.replace(">February 12, 2026</time>", f">{date}</time>")
+            replace(">February 12, 2026</time>", f">{date}</time>")
 
         # Intro paragraphs
         intro_p1 = get_translation(translations, "blog_post.intro_p1")
         if intro_p1:
-            html = html.replace(
+            replace(
                 "<p>On February 15, NJ Transit is implementing the largest service disruption in its history. For four weeks, as Amtrak connects the new Portal North Bridge to the Northeast Corridor, every rail line except the Atlantic City Rail Line will be affected. Roughly half of all trains between New Jersey and New York will be cut.</p>",
                 f"<p>{intro_p1}</p>"
             )
 
         intro_p2 = get_translation(translations, "blog_post.intro_p2")
         if intro_p2:
-            html = html.replace(
-                "<p>Hundreds of thousands of commuters need to figure out, in a short time, how their daily routine changes. The official resources don&#x27;t always give you the clear, personalized answer you need at 6:30 in the morning when you&#x27;re trying to get to work.</p>",
-                f"<p>{intro_p2}</p>"
-            )
-            # Also try with literal apostrophes
-            html = html.replace(
+            replace_apostrophes(
                 "<p>Hundreds of thousands of commuters need to figure out, in a short time, how their daily routine changes. The official resources don't always give you the clear, personalized answer you need at 6:30 in the morning when you're trying to get to work.</p>",
                 f"<p>{intro_p2}</p>"
             )
 
         intro_p3 = get_translation(translations, "blog_post.intro_p3")
         if intro_p3:
-            html = html.replace(
+            replace(
                 "<p>Reroute NJ is an attempt to help.</p>",
                 f"<p>{intro_p3}</p>"
             )
@@ -1318,52 +1648,30 @@ def replace_page_specific_content(html, translations, page_key):
         # Section headings
         for key, eng_text in [
             ("blog_post.h2_tools", "Five tools, eleven languages"),
-            ("blog_post.h2_built", "Why it&#x27;s built the way it is"),
+            ("blog_post.h2_built", "Why it's built the way it is"),
             ("blog_post.h2_newsrooms", "For newsrooms and publishers"),
             ("blog_post.h2_help", "How you can help"),
             ("blog_post.h2_bigger", "The bigger picture"),
         ]:
             translated = get_translation(translations, key)
             if translated:
-                html = html.replace(f">{eng_text}<", f">{translated}<")
-        # Also try with literal apostrophe for "Why it's built..."
-        h2_built = get_translation(translations, "blog_post.h2_built")
-        if h2_built:
-            html = html.replace(">Why it's built the way it is<", f">{h2_built}<")
+                replace_apostrophes(f">{eng_text}<", f">{translated}<")
 
         # Tools intro
         tools_intro = get_translation(translations, "blog_post.tools_intro")
         if tools_intro:
-            html = html.replace(
+            replace_apostrophes(
                 "<p>We built five interactive tools that help riders answer the questions they're asking:</p>",
                 f"<p>{tools_intro}</p>"
             )
-            html = html.replace(
-                "<p>We built five interactive tools that help riders answer the questions they&#x27;re asking:</p>",
-                f"<p>{tools_intro}</p>"
-            )
 
         # Tool description paragraphs
-        tool_items = {
-            "blog_post.tool_line_guide": '<strong><a href="../index.html">Line guide</a></strong> &mdash; Select your NJ Transit line and station to see exactly how your commute changes, what alternative routes are available, and what tickets you need. Works for both directions: morning commuters heading into NYC and evening commuters heading home.',
-            "blog_post.tool_compare": '<strong><a href="../compare.html">Commute comparison</a></strong> &mdash; Pick your NJ station and your Manhattan destination, and see every route option side by side with visual time breakdowns. PATH vs. ferry vs. bus, ranked by total travel time, with cost and transfer details.',
-            "blog_post.tool_coverage": '<strong><a href="../coverage.html">News coverage</a></strong> &mdash; Curated reporting about the cutover from more than a dozen regional news sources. Filter by source, line, direction, or category.',
-            "blog_post.tool_map": '<strong><a href="../map.html">Interactive map</a></strong> &mdash; All five affected NJ Transit lines rendered on a map with station markers, key transfer points (Hoboken Terminal, Secaucus Junction, Newark Penn), and the Portal Bridge location over the Hackensack River.',
-            "blog_post.tool_embed": '<strong><a href="../embed.html">Embed and share</a></strong> &mdash; Iframe embed codes, direct links, and instructions for newsrooms and publishers who want to republish any of these tools on their own sites.',
-        }
-        for key, eng_text in tool_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
+        replace_wrapped(BLOG_POST_TOOL_ITEMS.items(), "<p>", "</p>")
 
         # Tools languages paragraph
         tools_languages = get_translation(translations, "blog_post.tools_languages")
         if tools_languages:
-            html = html.replace(
-                "<p>Every tool page is available in 11 languages: English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These aren&#x27;t machine-translated afterthoughts &mdash; each language has its own set of pages with translated navigation, labels, descriptions, and metadata. Station names, line names, and place names stay in English because that&#x27;s what&#x27;s on the signs.</p>",
-                f"<p>{tools_languages}</p>"
-            )
-            html = html.replace(
+            replace_apostrophes(
                 "<p>Every tool page is available in 11 languages: English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These aren't machine-translated afterthoughts &mdash; each language has its own set of pages with translated navigation, labels, descriptions, and metadata. Station names, line names, and place names stay in English because that's what's on the signs.</p>",
                 f"<p>{tools_languages}</p>"
             )
@@ -1371,25 +1679,21 @@ def replace_page_specific_content(html, translations, page_key):
         # "Why it's built" paragraphs
         built_p1 = get_translation(translations, "blog_post.built_p1")
         if built_p1:
-            html = html.replace(
+            replace(
                 "<p>Reroute NJ is a zero-build static site. Plain HTML, CSS, and JavaScript. No frameworks, no npm, no build step. You can fork the repo, edit a file, and deploy it on GitHub Pages in minutes.</p>",
                 f"<p>{built_p1}</p>"
             )
 
         built_p2 = get_translation(translations, "blog_post.built_p2")
         if built_p2:
-            html = html.replace(
+            replace(
                 "<p>We wanted the project to be accessible to anyone who might want to contribute &mdash; journalists who can add articles to the coverage feed, community members who can report inaccuracies, and developers who can add features. Lowering the barrier to contribution matters more than using the latest technology.</p>",
                 f"<p>{built_p2}</p>"
             )
 
         built_p3 = get_translation(translations, "blog_post.built_p3")
         if built_p3:
-            html = html.replace(
-                "<p>Everything is client-side. No server, no database, no API keys. The data is bundled as JSON and JavaScript objects. The site is fast and works even if GitHub&#x27;s servers are under load.</p>",
-                f"<p>{built_p3}</p>"
-            )
-            html = html.replace(
+            replace_apostrophes(
                 "<p>Everything is client-side. No server, no database, no API keys. The data is bundled as JSON and JavaScript objects. The site is fast and works even if GitHub's servers are under load.</p>",
                 f"<p>{built_p3}</p>"
             )
@@ -1397,29 +1701,16 @@ def replace_page_specific_content(html, translations, page_key):
         # Newsrooms section
         newsrooms_intro = get_translation(translations, "blog_post.newsrooms_intro")
         if newsrooms_intro:
-            html = html.replace(
+            replace(
                 "<p>We built Reroute NJ to be shared, embedded, and republished. If you run a local news site, a community blog, or a transit advocacy page, we want you to use these tools.</p>",
                 f"<p>{newsrooms_intro}</p>"
             )
 
-        newsrooms_items = {
-            "blog_post.newsrooms_item1": '<strong>Embed any tool</strong> on your website using our <a href="../embed.html">embed code generator</a>. Copy and paste an iframe.',
-            "blog_post.newsrooms_item2": '<strong>Link to the tools</strong> from your Portal Bridge coverage. The URLs are permanent and have social meta tags for clean previews.',
-            "blog_post.newsrooms_item3": '<strong>Fork the project</strong> and run your own branded version. The <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">code is MIT-licensed</a>. Change the colors, add your logo, deploy it on your own domain.',
-            "blog_post.newsrooms_item4": '<strong>Add your coverage</strong> to our <a href="../coverage.html">news feed</a>. <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">Open a GitHub issue</a> or email <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> with your article links.',
-        }
-        for key, eng_text in newsrooms_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(BLOG_POST_NEWSROOMS_ITEMS.items(), "<li>", "</li>")
 
         newsrooms_outro = get_translation(translations, "blog_post.newsrooms_outro")
         if newsrooms_outro:
-            html = html.replace(
-                "<p>We&#x27;re interested in hearing from local publishers and community news outlets who serve the specific towns affected by the cutover. Your local coverage is what riders need, and we want to help get it in front of them.</p>",
-                f"<p>{newsrooms_outro}</p>"
-            )
-            html = html.replace(
+            replace_apostrophes(
                 "<p>We're interested in hearing from local publishers and community news outlets who serve the specific towns affected by the cutover. Your local coverage is what riders need, and we want to help get it in front of them.</p>",
                 f"<p>{newsrooms_outro}</p>"
             )
@@ -1427,52 +1718,34 @@ def replace_page_specific_content(html, translations, page_key):
         # How you can help section
         help_intro = get_translation(translations, "blog_post.help_intro")
         if help_intro:
-            html = html.replace(
+            replace(
                 "<p>This is a community project and we need community help:</p>",
                 f"<p>{help_intro}</p>"
             )
 
-        help_items = {
-            "blog_post.help_item1": '<strong>Share the tool.</strong> Text it to your train friends. Post it in your town\'s Facebook group. The more people who know about it, the better it works.',
-            "blog_post.help_item2": '<strong>Report inaccuracies.</strong> If a travel time estimate is wrong, or a schedule change isn\'t reflected, <a href="https://github.com/jamditis/reroute-nj/issues" target="_blank" rel="noopener">let us know</a>.',
-            "blog_post.help_item3": '<strong>Suggest articles.</strong> Found good Portal Bridge coverage we haven\'t listed? <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">Submit it</a>.',
-            "blog_post.help_item4": '<strong>Contribute code.</strong> The <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">GitHub repo</a> is open. No build step, no framework knowledge required. If you can edit HTML, you can contribute.',
-            "blog_post.help_item5": '<strong>Help with accessibility.</strong> We want the tool to work for everyone. Screen reader testing, keyboard navigation improvements, and WCAG compliance review are all welcome.',
-        }
-        for key, eng_text in help_items.items():
+        for key, eng_text in BLOG_POST_HELP_ITEMS.items():
             translated = get_translation(translations, key)
             if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
-                # Also try with HTML entity apostrophes
-                eng_entity = eng_text.replace("'", "&#x27;")
-                html = html.replace(f"<li>{eng_entity}</li>", f"<li>{translated}</li>")
+                replace_apostrophes(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
 
         # The bigger picture paragraphs
         bigger_p1 = get_translation(translations, "blog_post.bigger_p1")
         if bigger_p1:
-            html = html.replace(
-                "<p>The Portal Bridge cutover is painful, but it&#x27;s a good thing. The 115-year-old Portal Bridge has been the worst bottleneck on the Northeast Corridor for decades. Every time it gets stuck opening for boat traffic, cascading delays affect hundreds of thousands of riders. The new Portal North Bridge eliminates that problem.</p>",
-                f"<p>{bigger_p1}</p>"
-            )
-            html = html.replace(
+            replace_apostrophes(
                 "<p>The Portal Bridge cutover is painful, but it's a good thing. The 115-year-old Portal Bridge has been the worst bottleneck on the Northeast Corridor for decades. Every time it gets stuck opening for boat traffic, cascading delays affect hundreds of thousands of riders. The new Portal North Bridge eliminates that problem.</p>",
                 f"<p>{bigger_p1}</p>"
             )
 
         bigger_p2 = get_translation(translations, "blog_post.bigger_p2")
         if bigger_p2:
-            html = html.replace(
-                "<p>This four-week disruption is the price of progress. When Phase 2 comes in the fall of 2026, we&#x27;ll update Reroute NJ to cover that, too.</p>",
-                f"<p>{bigger_p2}</p>"
-            )
-            html = html.replace(
+            replace_apostrophes(
                 "<p>This four-week disruption is the price of progress. When Phase 2 comes in the fall of 2026, we'll update Reroute NJ to cover that, too.</p>",
                 f"<p>{bigger_p2}</p>"
             )
 
         bigger_p3 = get_translation(translations, "blog_post.bigger_p3")
         if bigger_p3:
-            html = html.replace(
+            replace(
                 "<p>In the meantime, we hope these tools make the next month a little easier to navigate. Plan ahead, be patient with each other on the platforms, and remember: this is temporary.</p>",
                 f"<p>{bigger_p3}</p>"
             )
@@ -1480,7 +1753,7 @@ def replace_page_specific_content(html, translations, page_key):
         # CTA button
         cta = get_translation(translations, "blog_post.cta")
         if cta:
-            html = html.replace(
+            replace(
                 '>Plan your commute &rarr;</a>',
                 f'>{cta.replace("→", "&rarr;")}</a>'
             )
@@ -1490,71 +1763,60 @@ def replace_page_specific_content(html, translations, page_key):
         # Back/footer nav links
         all_posts = get_translation(translations, "blog.all_posts")
         if all_posts:
-            html = html.replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
+            replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
         back_all = get_translation(translations, "blog.back_to_all_posts")
         if back_all:
-            html = html.replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
+            replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
 
         heading = get_translation(translations, "blog_post_bridge.heading")
         if heading:
-            html = html.replace(">The new Portal North Bridge is open</h1>", f">{heading}</h1>")
+            replace(">The new Portal North Bridge is open</h1>", f">{heading}</h1>")
 
         by_prefix = get_translation(translations, "blog_post_bridge.by_prefix")
         if by_prefix:
-            html = html.replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
+            replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
 
         date = get_translation(translations, "blog_post_bridge.date")
         if date:
-            html = html.replace(">March 13, 2026</time>", f">{date}</time>")
+            replace(">March 13, 2026</time>", f">{date}</time>")
 
         # Intro paragraphs
         intro_p1 = get_translation(translations, "blog_post_bridge.intro_p1")
         if intro_p1:
-            html = html.replace(
+            replace(
                 "<p>The wait is over. On March 12, Governor Mikie Sherrill and officials from NJ Transit and Amtrak rode the first ceremonial train across the new Portal North Bridge. Starting Monday, March 16, the first track on the new bridge enters regular passenger service. Regular NJ Transit schedules resume Sunday, March 15.</p>",
                 f"<p>{intro_p1}</p>"
             )
 
         intro_p2 = get_translation(translations, "blog_post_bridge.intro_p2")
         if intro_p2:
-            html = html.replace(
+            replace(
                 "<p>Phase 1 of the cutover is complete. After four weeks of reduced service, Hoboken diversions, and single-track operations between Newark and Secaucus, riders can return to their normal commutes.</p>",
                 f"<p>{intro_p2}</p>"
             )
 
         # Section headings
-        for key, eng_text in [
+        replace_wrapped([
             ("blog_post_bridge.h2_what_means", "What this means for riders"),
             ("blog_post_bridge.h2_new_bridge", "What is the new bridge?"),
             ("blog_post_bridge.h2_what_next", "What comes next"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h2>{eng_text}</h2>", f"<h2>{translated}</h2>")
+        ], "<h2>", "</h2>")
 
         # What means intro
         what_means_intro = get_translation(translations, "blog_post_bridge.what_means_intro")
         if what_means_intro:
-            html = html.replace(
+            replace(
                 "<p>Starting Sunday, March 15, the temporary cutover schedules end. Here is what changes:</p>",
                 f"<p>{what_means_intro}</p>"
             )
 
         # What means list items
-        wm_items = {
-            "blog_post_bridge.wm_hoboken": '<strong>Montclair-Boonton and Morris &amp; Essex lines</strong> return to New York Penn Station. No more Hoboken diversions.',
-            "blog_post_bridge.wm_full_service": '<strong>Northeast Corridor and North Jersey Coast Line</strong> resume full service frequency.',
-            "blog_post_bridge.wm_raritan": '<strong>Raritan Valley Line</strong> restores one-seat rides to Penn Station.',
-        }
-        for key, eng_text in wm_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(BLOG_POST_BRIDGE_WM_ITEMS.items(), "<li>", "</li>")
 
         # What means p2
         what_means_p2 = get_translation(translations, "blog_post_bridge.what_means_p2")
         if what_means_p2:
-            html = html.replace(
+            replace(
                 "<p>On Monday, March 16, westbound trains begin using the first track on the new Portal North Bridge. Eastbound trains continue on the old bridge until Phase 2 in the fall.</p>",
                 f"<p>{what_means_p2}</p>"
             )
@@ -1562,14 +1824,14 @@ def replace_page_specific_content(html, translations, page_key):
         # New bridge paragraphs
         new_bridge_p = get_translation(translations, "blog_post_bridge.new_bridge_p")
         if new_bridge_p:
-            html = html.replace(
+            replace(
                 '<p>The Portal North Bridge is a modern, high-level, fixed-span bridge that rises 50 feet over the Hackensack River. It replaces the 116-year-old Portal Bridge, a swing bridge that had to open for boat traffic dozens of times each year &mdash; and frequently got stuck. The new bridge eliminates that problem entirely. Trains can travel up to 90 mph, compared to 60 mph on the old structure.</p>',
                 f"<p>{new_bridge_p}</p>"
             )
 
         new_bridge_p2 = get_translation(translations, "blog_post_bridge.new_bridge_p2")
         if new_bridge_p2:
-            html = html.replace(
+            replace(
                 "<p>The $2.3 billion project is the first major bridge cutover completed on the Northeast Corridor and a critical piece of the larger Gateway Program.</p>",
                 f"<p>{new_bridge_p2}</p>"
             )
@@ -1577,14 +1839,14 @@ def replace_page_specific_content(html, translations, page_key):
         # What next paragraphs
         what_next_p1 = get_translation(translations, "blog_post_bridge.what_next_p1")
         if what_next_p1:
-            html = html.replace(
+            replace(
                 "<p>This is not the end. Phase 2 will move the second track onto the new bridge, expected in fall 2026. That means another round of temporary schedule changes and service reductions. Reroute NJ will be here for that, too.</p>",
                 f"<p>{what_next_p1}</p>"
             )
 
         what_next_p2 = get_translation(translations, "blog_post_bridge.what_next_p2")
         if what_next_p2:
-            html = html.replace(
+            replace(
                 "<p>Once both tracks are on the new bridge, the original 1910 Portal Bridge will be permanently retired and dismantled in 2027.</p>",
                 f"<p>{what_next_p2}</p>"
             )
@@ -1592,7 +1854,7 @@ def replace_page_specific_content(html, translations, page_key):
         # Closing
         closing = get_translation(translations, "blog_post_bridge.closing")
         if closing:
-            html = html.replace(
+            replace(
                 "<p>Four weeks of disruption for decades of better, faster, more reliable service. It was worth it.</p>",
                 f"<p>{closing}</p>"
             )
@@ -1600,7 +1862,7 @@ def replace_page_specific_content(html, translations, page_key):
         # Support note
         support_p = get_translation(translations, "blog_post_bridge.support_p")
         if support_p:
-            html = html.replace(
+            replace(
                 '<p class="blog-support-note" style="font-size: 0.85rem; color: var(--text-muted); margin-top: 2rem;">Reroute NJ is free, open source, and community-supported. If you find it useful, share it with someone who rides NJ Transit or <a href="https://github.com/sponsors/jamditis" target="_blank" rel="noopener">support the project</a>.</p>',
                 f'<p class="blog-support-note" style="font-size: 0.85rem; color: var(--text-muted); margin-top: 2rem;">{support_p}</p>'
             )
@@ -1608,7 +1870,7 @@ def replace_page_specific_content(html, translations, page_key):
         # CTA button
         cta = get_translation(translations, "blog_post_bridge.cta")
         if cta:
-            html = html.replace(
+            replace(
                 '>See full news coverage &rarr;</a>',
                 f'>{cta.replace("→", "&rarr;")}</a>'
             )
@@ -1618,104 +1880,79 @@ def replace_page_specific_content(html, translations, page_key):
         # Back/footer nav links
         all_posts = get_translation(translations, "blog.all_posts")
         if all_posts:
-            html = html.replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
+            replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
         back_all = get_translation(translations, "blog.back_to_all_posts")
         if back_all:
-            html = html.replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
+            replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
 
         heading = get_translation(translations, "blog_post_cutover.heading")
         if heading:
-            html = html.replace(">The cutover starts today</h1>", f">{heading}</h1>")
+            replace(">The cutover starts today</h1>", f">{heading}</h1>")
 
         by_prefix = get_translation(translations, "blog_post_cutover.by_prefix")
         if by_prefix:
-            html = html.replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
+            replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
 
         date = get_translation(translations, "blog_post_cutover.date")
         if date:
-            html = html.replace(">February 15, 2026</time>", f">{date}</time>")
+            replace(">February 15, 2026</time>", f">{date}</time>")
 
         # Intro paragraphs
         intro_p1 = get_translation(translations, "blog_post_cutover.intro_p1")
         if intro_p1:
-            html = html.replace(
+            replace(
                 "<p>The Portal North Bridge cutover is happening. Starting today, February 15, Amtrak is connecting the new bridge to the Northeast Corridor, and NJ Transit service will be disrupted for four weeks. Every rail line except the Atlantic City Rail Line is affected.</p>",
                 f"<p>{intro_p1}</p>"
             )
 
         intro_p2 = get_translation(translations, "blog_post_cutover.intro_p2")
         if intro_p2:
-            html = html.replace(
+            replace(
                 "<p>If you ride NJ Transit into New York, your commute changes today. This post covers what you need to know and how Reroute NJ can help you figure out the specifics.</p>",
                 f"<p>{intro_p2}</p>"
             )
 
         # Section headings
-        for key, eng_text in [
+        replace_wrapped([
             ("blog_post_cutover.h2_need_to_know", "What you need to know"),
             ("blog_post_cutover.h2_how_helps", "How Reroute NJ helps"),
             ("blog_post_cutover.h2_languages", "Available in 11 languages"),
-        ]:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h2>{eng_text}</h2>", f"<h2>{translated}</h2>")
+        ], "<h2>", "</h2>")
 
         # Need to know paragraph
         need_to_know_p = get_translation(translations, "blog_post_cutover.need_to_know_p")
         if need_to_know_p:
-            html = html.replace(
+            replace(
                 "<p>The cutover runs from February 15 through March 15, 2026. During this period, roughly half of all NJ Transit trains between New Jersey and New York Penn Station will be cut. The impact depends on your line:</p>",
                 f"<p>{need_to_know_p}</p>"
             )
 
         # Need to know list items
-        ntk_items = {
-            "blog_post_cutover.ntk_hoboken": '<strong>Montclair-Boonton and Morris &amp; Essex lines</strong> are diverted to Hoboken Terminal instead of New York Penn Station. From Hoboken, you transfer to PATH, ferry, or bus to reach Manhattan.',
-            "blog_post_cutover.ntk_reduced": '<strong>Northeast Corridor and North Jersey Coast Line</strong> continue to New York Penn Station but with reduced frequency. Fewer trains, longer waits.',
-            "blog_post_cutover.ntk_newark": '<strong>Raritan Valley Line</strong> loses all one-seat rides to Penn Station. Trains terminate at Newark Penn Station. Transfer to Northeast Corridor or PATH from there.',
-        }
-        for key, eng_text in ntk_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(BLOG_POST_CUTOVER_NTK_ITEMS.items(), "<li>", "</li>")
 
         # How helps intro
         how_helps_intro = get_translation(translations, "blog_post_cutover.how_helps_intro")
         if how_helps_intro:
-            html = html.replace(
+            replace(
                 "<p>We built five tools to help you navigate the next four weeks:</p>",
                 f"<p>{how_helps_intro}</p>"
             )
 
         # Tool description paragraphs
-        tool_items = {
-            "blog_post_cutover.tool_line_guide": '<strong><a href="../index.html">Line guide</a></strong> &mdash; Select your line and station to see exactly how your commute changes, what alternative routes are available, and what tickets you need.',
-            "blog_post_cutover.tool_compare": '<strong><a href="../compare.html">Commute comparison</a></strong> &mdash; Pick your NJ station and your Manhattan destination, then see every route option side by side with travel times, costs, and transfer details.',
-            "blog_post_cutover.tool_coverage": '<strong><a href="../coverage.html">News coverage</a></strong> &mdash; Reporting about the cutover from local and regional news sources, updated throughout the day. Filter by source, line, or category.',
-            "blog_post_cutover.tool_map": '<strong><a href="../map.html">Interactive map</a></strong> &mdash; All five affected lines rendered on a map with station markers, transfer points, and the Portal Bridge location.',
-            "blog_post_cutover.tool_embed": '<strong><a href="../embed.html">Embed and share</a></strong> &mdash; Embed codes and tools for newsrooms and publishers who want to put these resources on their own sites.',
-        }
-        for key, eng_text in tool_items.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
+        replace_wrapped(BLOG_POST_CUTOVER_TOOL_ITEMS.items(), "<p>", "</p>")
 
         # Languages paragraph
         languages_p = get_translation(translations, "blog_post_cutover.languages_p")
         if languages_p:
-            html = html.replace(
+            replace_apostrophes(
                 "<p>Every page on Reroute NJ is available in English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These are the most commonly spoken languages in New Jersey. Each language has its own complete set of translated pages with navigation, labels, descriptions, and metadata. Station names and line names stay in English because that's what's on the signs.</p>",
                 f"<p>{languages_p}</p>"
             )
-            html = html.replace(
-                "<p>Every page on Reroute NJ is available in English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These are the most commonly spoken languages in New Jersey. Each language has its own complete set of translated pages with navigation, labels, descriptions, and metadata. Station names and line names stay in English because that&#x27;s what&#x27;s on the signs.</p>",
-                f"<p>{languages_p}</p>"
-            )
 
         # Support note (deemphasized)
         support_p = get_translation(translations, "blog_post_cutover.support_p")
         if support_p:
-            html = html.replace(
+            replace(
                 '<p class="blog-support-note" style="font-size: 0.85rem; color: var(--text-muted); margin-top: 2rem;">Reroute NJ is free, open source, and community-supported. If you find it useful, share it with someone who rides NJ Transit or <a href="https://github.com/sponsors/jamditis" target="_blank" rel="noopener">support the project</a>.</p>',
                 f'<p class="blog-support-note" style="font-size: 0.85rem; color: var(--text-muted); margin-top: 2rem;">{support_p}</p>'
             )
@@ -1723,26 +1960,22 @@ def replace_page_specific_content(html, translations, page_key):
         # Closing paragraphs
         closing_p1 = get_translation(translations, "blog_post_cutover.closing_p1")
         if closing_p1:
-            html = html.replace(
+            replace(
                 "<p>This disruption is temporary. The new Portal North Bridge will replace a 115-year-old bottleneck that has caused cascading delays across the Northeast Corridor for decades. Four weeks of pain for years of better service.</p>",
                 f"<p>{closing_p1}</p>"
             )
 
         closing_p2 = get_translation(translations, "blog_post_cutover.closing_p2")
         if closing_p2:
-            html = html.replace(
+            replace_apostrophes(
                 "<p>Plan ahead, leave early, and be patient with each other on the platforms. We'll get through it.</p>",
                 f"<p>{closing_p2}</p>"
             )
-            html = html.replace(
-                "<p>Plan ahead, leave early, and be patient with each other on the platforms. We&#x27;ll get through it.</p>",
-                f"<p>{closing_p2}</p>"
-            )
 
         # CTA button
         cta = get_translation(translations, "blog_post_cutover.cta")
         if cta:
-            html = html.replace(
+            replace(
                 '>Plan your commute &rarr;</a>',
                 f'>{cta.replace("→", "&rarr;")}</a>'
             )
@@ -1752,79 +1985,36 @@ def replace_page_specific_content(html, translations, page_key):
         # Back/footer nav links
         all_posts = get_translation(translations, "blog.all_posts")
         if all_posts:
-            html = html.replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
+            replace(">&larr; All posts</a>", f">&larr; {all_posts}</a>")
         back_all = get_translation(translations, "blog.back_to_all_posts")
         if back_all:
-            html = html.replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
+            replace(">&larr; Back to all posts</a>", f">&larr; {back_all}</a>")
 
         heading = get_translation(translations, "blog_post_embed.heading")
         if heading:
-            html = html.replace(">New: Embed Reroute NJ on your website</h1>", f">{heading}</h1>")
+            replace(">New: Embed Reroute NJ on your website</h1>", f">{heading}</h1>")
 
         by_prefix = get_translation(translations, "blog_post_embed.by_prefix")
         if by_prefix:
-            html = html.replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
+            replace(">By Joe Amditis</span>", f">{by_prefix} Joe Amditis</span>")
 
         date = get_translation(translations, "blog_post_embed.date")
         if date:
-            html = html.replace(">February 13, 2026</time>", f">{date}</time>")
+            replace(">February 13, 2026</time>", f">{date}</time>")
 
         # Body paragraphs
-        para_map = {
-            "blog_post_embed.intro_p1": "The Portal Bridge cutover starts Saturday. If you cover transit in New Jersey &mdash; or if you run a community site, town Facebook page, or commuter forum &mdash; you can now put Reroute NJ tools directly on your website.",
-            "blog_post_embed.intro_p2": "We just shipped a full embed system. Four output formats, a visual configurator that builds the embed code for you, and PNG export for social media and email newsletters. Everything is free to use.",
-            "blog_post_embed.format_cards": '<strong>Info cards</strong> &mdash; Compact cards showing line impact, station details, or a full cutover summary. Drop one into an article sidebar or at the top of a liveblog. Three card types: line cards (one line\'s impact), station cards (one station\'s changes), and summary cards (all five lines at a glance).',
-            "blog_post_embed.format_widgets": '<strong>Interactive widgets</strong> &mdash; Mini versions of the line guide, comparison tool, news feed, or map. These are live, working tools that readers can interact with inside your page. Pick a tool and it loads in an iframe sized to fit.',
-            "blog_post_embed.format_full": '<strong>Full tool embeds</strong> &mdash; Any Reroute NJ page with the header and footer stripped out. Append <code>?embed=true</code> to any tool URL and it becomes embeddable. Good for dedicated cutover pages where you want to give readers the complete experience.',
-            "blog_post_embed.format_script": '<strong>Script-tag embeds</strong> &mdash; A single <code>&lt;script&gt;</code> tag and a <code>&lt;div&gt;</code>. No iframe configuration needed. Add the div with data attributes for the embed type, line, and station, include the script, and it handles the rest. Works in CMSes where pasting iframe code is restricted.',
-            "blog_post_embed.configurator_p1": 'The <a href="../embed.html">embed page</a> has a visual configurator that walks you through choosing your embed type, selecting the line and station, picking a theme (light or dark), and setting a custom accent color. It shows a live preview and gives you copy-paste code in all four formats.',
-            "blog_post_embed.configurator_p2": 'For info cards, you also get a <strong>Download PNG</strong> button that renders the card to a high-fidelity image. The PNG export uses Canvas rendering (not a screenshot), so text stays sharp at any size. Use it in newsletters, tweets, or print handouts.',
-            "blog_post_embed.configurator_p3": 'There\'s also a <strong>Download HTML</strong> option that gives you a self-contained file with all styles and data bundled in. No external dependencies, no network requests. Open it in a browser and it works offline.',
-            "blog_post_embed.customization_intro": "Every embed supports two customization options:",
-            "blog_post_embed.customization_outro": "Match the embed to your site\'s design without touching any code.",
-            "blog_post_embed.newsrooms_p1": "We built this for you. The cutover will dominate transit coverage in the region for a month, and your readers need tools, not just articles. A line card in your sidebar tells a Montclair-Boonton commuter exactly what changes for them. A comparison widget lets a reader punch in their station and see every alternative route.",
-            "blog_post_embed.newsrooms_p2": 'The embed codes work on WordPress, Squarespace, Ghost, Substack (with the script-tag format), and any platform that accepts HTML. If you run into trouble embedding on your specific platform, <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">open an issue</a> or email <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> and we\'ll help.',
-            "blog_post_embed.newsrooms_p3": 'Everything is MIT-licensed. No attribution required, though we appreciate a link back to <a href="https://reroutenj.org">reroutenj.org</a>.',
-            "blog_post_embed.whatelse_intro": "Along with the embed system, this release includes:",
-            "blog_post_embed.tryit_p1": 'Go to the <a href="../embed.html">embed configurator</a>, pick a format, and copy the code. It takes about 30 seconds.',
-            "blog_post_embed.tryit_p2": 'If you embed Reroute NJ on your site, we\'d like to know about it. Drop us a line at <a href="mailto:amditisj@montclair.edu">amditisj@montclair.edu</a> &mdash; we\'ll add your site to our <a href="../coverage.html">coverage page</a>.',
-        }
-        for key, eng_text in para_map.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
+        replace_wrapped(BLOG_POST_EMBED_PARA_MAP.items(), "<p>", "</p>")
 
         # H2 headings
-        h2_map = [
-            ("blog_post_embed.h2_formats", "Four ways to embed"),
-            ("blog_post_embed.h2_configurator", "The configurator"),
-            ("blog_post_embed.h2_customization", "Customization"),
-            ("blog_post_embed.h2_newsrooms", "For newsrooms"),
-            ("blog_post_embed.h2_whatelse", "What else is new"),
-            ("blog_post_embed.h2_tryit", "Try it"),
-        ]
-        for key, eng_text in h2_map:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h2>{eng_text}</h2>", f"<h2>{translated}</h2>")
+        replace_wrapped(BLOG_POST_EMBED_H2_MAP, "<h2>", "</h2>")
 
         # List items
-        li_map = {
-            "blog_post_embed.customization_theme": '<strong>Theme</strong> &mdash; Light or dark. Append <code>&amp;theme=dark</code> to any embed URL or set <code>data-theme="dark"</code> on the script-tag div.',
-            "blog_post_embed.customization_accent": '<strong>Accent color</strong> &mdash; Any hex color. Append <code>&amp;accent=FF6B35</code> or set <code>data-accent="FF6B35"</code>. The accent applies to CTA buttons and color highlights.',
-            "blog_post_embed.whatelse_blog": "<strong>Blog in all 11 languages</strong> &mdash; Blog posts are now translated alongside the rest of the site. The blog has its own index page with a proper post structure.",
-            "blog_post_embed.whatelse_seo": '<strong>SEO and AI search optimization</strong> &mdash; Structured data (JSON-LD), full hreflang cross-references, <code>robots.txt</code> with AI bot guidance, <code>llms.txt</code> for AI search engines, and <code>sitemap.xml</code> covering all 79 pages.',
-            "blog_post_embed.whatelse_html": "<strong>Self-contained HTML downloads</strong> &mdash; Export any info card as a standalone HTML file that works without an internet connection.",
-        }
-        for key, eng_text in li_map.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(BLOG_POST_EMBED_LI_MAP.items(), "<li>", "</li>")
 
         # CTA button
         cta = get_translation(translations, "blog_post_embed.cta")
         if cta:
-            html = html.replace(
+            replace(
                 '>Try the embed configurator &rarr;</a>',
                 f'>{cta.replace("→", "&rarr;")}</a>'
             )
@@ -1833,108 +2023,79 @@ def replace_page_specific_content(html, translations, page_key):
         # About / methodology page
         heading = get_translation(translations, "about.heading")
         if heading:
-            html = html.replace(">About our methodology</h1>", f">{heading}</h1>")
+            replace(">About our methodology</h1>", f">{heading}</h1>")
 
         intro = get_translation(translations, "about.intro")
         if intro:
-            html = html.replace(
+            replace(
                 "Reroute NJ gives commuters specific guidance: which train to take, which ticket to buy, where to transfer. That information has to be right. People depend on it to get to work on time. Our approach prioritizes accuracy and accessibility over everything else.",
                 intro
             )
 
         # H2 headings
-        h2_map = [
-            ("about.h2_translations", "How we produce translations"),
-            ("about.h2_verification", "How we verify transit data"),
-            ("about.h2_accessibility", "Our accessibility standards"),
-            ("about.h2_philosophy", "Why we built it this way"),
-            ("about.h2_mistakes", "What we get wrong"),
-        ]
-        for key, eng_text in h2_map:
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<h2>{eng_text}</h2>", f"<h2>{translated}</h2>")
+        replace_wrapped(ABOUT_H2_MAP, "<h2>", "</h2>")
 
         # Body paragraphs
-        para_map = {
-            "about.translations_p1": 'Every tool on this site is available in 11 languages: English, Spanish, Chinese, Tagalog, Korean, Portuguese, Gujarati, Hindi, Italian, Arabic, and Polish. These languages were chosen because they are the most commonly spoken languages in New Jersey according to U.S. Census data.',
-            "about.translations_p2": 'Translations are produced with the help of AI language models and reviewed for natural phrasing and accuracy. Each language gets its own complete set of HTML pages with translated navigation, labels, headings, descriptions, accessibility text, and metadata. This is not a browser auto-translate overlay &mdash; every translated page is a standalone document that works without JavaScript if necessary.',
-            "about.translations_rules": "We follow specific rules about what gets translated and what doesn't:",
-            "about.translations_fidelity": 'This is a deliberate choice: fidelity to what riders actually see and hear at the station matters more than linguistic consistency. A Spanish-speaking commuter looking at their phone needs to read "Tome el tren a Hoboken Terminal" &mdash; not "Tome el tren a Terminal de Hoboken" &mdash; because the sign above the platform says "Hoboken Terminal."',
-            "about.verification_p1": 'Every claim on this site &mdash; train counts, schedule changes, fare information, transfer directions &mdash; is traceable to an official source. We maintain a <a href="https://github.com/jamditis/reroute-nj/blob/main/data/sources.json" target="_blank" rel="noopener">citation database</a> linking 28 specific claims to the official NJ Transit, Amtrak, PATH, and NY Waterway pages they come from.',
-            "about.verification_intro": "Our verification process:",
-            "about.accessibility_p1": 'Accessibility is not a feature we added &mdash; it\'s a constraint we designed around. The site meets WCAG 2.1 AA, the international standard for web accessibility.',
-            "about.accessibility_intro": "What that means in practice:",
-            "about.philosophy_p1": "Reroute NJ is a plain HTML, CSS, and JavaScript site. No frameworks, no build step, no server, no database. This isn't a technology preference &mdash; it's a reliability decision.",
-            "about.philosophy_p2": "During the cutover, hundreds of thousands of commuters will need this information at peak hours. A static site served from a CDN handles traffic spikes without breaking. It works on old phones, slow connections, and every browser. There's no server to go down, no API to rate-limit, no dependency to break.",
-            "about.philosophy_p3": "The tools are designed for someone checking their phone at 6:30 in the morning, standing on a platform, trying to figure out if their train still runs. That person needs a clear answer fast. They don't need animations, loading spinners, or a signup form. Every design decision starts from that scenario.",
-            "about.mistakes_p1": "We make mistakes. When we find them, we fix them and document the change. A few things to know:",
-            "about.mistakes_p2": 'This is an independent project. We are not affiliated with NJ Transit, Amtrak, or any government agency. Always verify critical travel information at <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com</a> before traveling.',
-        }
-        for key, eng_text in para_map.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<p>{eng_text}</p>", f"<p>{translated}</p>")
+        replace_wrapped(ABOUT_PARA_MAP.items(), "<p>", "</p>")
 
         # List items
-        li_map = {
-            "about.li_stations": "<strong>Station names stay in English.</strong> \"Secaucus Junction\" is what's on the platform sign. Translating it would make it harder to find your train, not easier.",
-            "about.li_lines": '<strong>Line names stay in English.</strong> "Northeast Corridor" and "Montclair-Boonton Line" are official NJ Transit designations. They appear in English on every schedule, app, and sign.',
-            "about.li_places": '<strong>Place names stay in English.</strong> "Hoboken Terminal," "Penn Station New York," and "Port Authority" are proper nouns. Riders need to match what they see to what they read.',
-            "about.li_everything_else": "<strong>Everything else is translated.</strong> Instructions, descriptions, labels, navigation, button text, accessibility announcements, error messages, and page metadata are all translated into each language.",
-            "about.li_official_sources": '<strong>Official sources first.</strong> Train counts, diversions, cross-honoring policies, and fare information come from <a href="https://www.njtransit.com/portalcutover" target="_blank" rel="noopener">njtransit.com/portalcutover</a> and official NJ Transit press releases. We do not use secondhand reporting as a primary source for transit data.',
-            "about.li_automated_validation": "<strong>Automated validation.</strong> We run 698+ automated checks across 14 test suites that verify data structure, transit facts, cross-references between pages, HTML integrity, translation completeness, and accessibility compliance. These tests run before every change is published.",
-            "about.li_automated_monitoring": "<strong>Automated monitoring.</strong> A scraper checks official NJ Transit and Amtrak pages four times a day for schedule or policy changes. When content changes, we review and update the site.",
-            "about.li_source_attribution": "<strong>Source attribution on every page.</strong> Each line guide card and commute comparison result includes links to the official sources backing its claims, so riders can verify for themselves.",
-            "about.li_open_source": '<strong>Open source.</strong> The entire codebase, all data files, and all test suites are <a href="https://github.com/jamditis/reroute-nj" target="_blank" rel="noopener">public on GitHub</a>. Anyone can inspect, challenge, or correct the data.',
-            "about.li_high_contrast": "<strong>High contrast mode.</strong> A toggle on every page switches to a high-contrast color scheme for riders with low vision. The setting persists across pages.",
-            "about.li_simplified": "<strong>Simplified view.</strong> Strips decorative elements to reduce visual noise for riders who need fewer distractions.",
-            "about.li_keyboard": "<strong>Keyboard navigation.</strong> Every control is reachable by keyboard. Focus indicators are visible. The tab order follows the visual layout.",
-            "about.li_screenreader": "<strong>Screen reader support.</strong> ARIA labels, roles, and live regions let screen readers announce content changes. Skip-to-content links on every page.",
-            "about.li_touch": "<strong>Touch targets.</strong> All buttons and controls are at least 44 pixels on mobile &mdash; large enough to tap accurately on a bumpy train.",
-            "about.li_rtl": "<strong>Right-to-left support.</strong> The Arabic translation renders with proper right-to-left layout, text direction, and mirrored navigation.",
-            "about.li_print": "<strong>Print stylesheets.</strong> Every page prints cleanly for riders who want a paper backup.",
-            "about.li_travel_times": '<strong>Travel time estimates are approximations.</strong> We use published schedules and average travel times, not live data. Actual times will vary, especially during the cutover when the system is under stress.',
-            "about.li_schedules_change": "<strong>Schedules change.</strong> NJ Transit may adjust service during the cutover based on ridership patterns. We monitor for changes four times a day, but there may be a delay between an official update and our site reflecting it.",
-            "about.li_translation_errors": '<strong>Translations may have errors.</strong> While we work to make translations natural and accurate, we rely on AI-assisted translation. If you find an error in any language, please <a href="https://github.com/jamditis/reroute-nj/issues/new" target="_blank" rel="noopener">report it</a> and we\'ll fix it.',
-        }
-        for key, eng_text in li_map.items():
-            translated = get_translation(translations, key)
-            if translated:
-                html = html.replace(f"<li>{eng_text}</li>", f"<li>{translated}</li>")
+        replace_wrapped(ABOUT_LI_MAP.items(), "<li>", "</li>")
 
         # CTA button
         cta = get_translation(translations, "about.cta")
         if cta:
-            html = html.replace(
+            replace(
                 '>Plan your commute &rarr;</a>',
                 f'>{cta.replace("→", "&rarr;")}</a>'
             )
 
-    return html
+    return replacements
+
+
+def replace_page_specific_content(page, translations, page_key):
+    """Replace page-specific static content using translation keys."""
+    apply_replacements(page, page_replacements(translations, page_key))
+
+
+@functools.lru_cache(maxsize=None)
+def jsonld_source(raw_json):
+    """Parse a template JSON-LD block once and cache its re-serialized form.
 
+    Returns (data, formatted). The parsed dict is shared and must not be
+    mutated; each language parses its own copy to translate.
+    """
+    data = json.loads(raw_json)
+    return data, json.dumps(data, ensure_ascii=False, indent=4)
 
-def translate_jsonld(html, translations, page_key, lang, page_name):
+
+def translate_jsonld(page, translations, page_key, lang, page_name):
     """Translate JSON-LD structured data blocks for the target language.
 
     Finds each <script type="application/ld+json"> block, parses the JSON,
     translates fields based on @type, updates URLs with language prefix,
-    and replaces the block in the HTML.
+    and queues the replacement block on the page.
     """
-    pattern = re.compile(
-        r'(<script type="application/ld\+json">\s*)(.*?)(</script>)',
-        re.DOTALL
-    )
+    if JSONLD_OPEN not in page:
+        return
 
-    def replace_block(match):
-        prefix = match.group(1)
-        raw_json = match.group(2)
-        suffix = match.group(3)
+    site_root = "https://reroutenj.org/"
+    lang_root = f"https://reroutenj.org/{lang}/"
+
+    def localize_url(url):
+        # Point a site URL at this language's copy of the page
+        if url.startswith(site_root):
+            return lang_root + url[len(site_root):]
+        return url
+
+    def replace_block(body):
+        raw_json = body.lstrip()
+        prefix = JSONLD_OPEN + body[:len(body) - len(raw_json)]
 
         try:
-            data = json.loads(raw_json)
+            source, formatted = jsonld_source(raw_json)
         except json.JSONDecodeError:
-            return match.group(0)  # Leave malformed blocks untouched
+            return JSONLD_OPEN + body + JSONLD_CLOSE  # Leave malformed blocks untouched
+        data = json.loads(raw_json)
 
         schema_type = data.get("@type", "")
 
@@ -1980,10 +2141,7 @@ def translate_jsonld(html, translations, page_key, lang, page_name):
                         item["name"] = bc
                     # Update URL if present
                     if "item" in item:
-                        item["item"] = item["item"].replace(
-                            "https://reroutenj.org/",
-                            f"https://reroutenj.org/{lang}/"
-                        )
+                        item["item"] = localize_url(item["item"])
                 elif pos == 3:
                     # Third-level breadcrumb (blog post title)
                     bc = get_translation(translations, f"schema.breadcrumb_{page_key}")
@@ -1999,10 +2157,7 @@ def translate_jsonld(html, translations, page_key, lang, page_name):
                 data["description"] = desc
             # Update page URL
             if "url" in data:
-                data["url"] = data["url"].replace(
-                    "https://reroutenj.org/",
-                    f"https://reroutenj.org/{lang}/"
-                )
+                data["url"] = localize_url(data["url"])
             # Translate item list entries
             main_entity = data.get("mainEntity", {})
             if main_entity.get("@type") == "ItemList":
@@ -2012,10 +2167,7 @@ def translate_jsonld(html, translations, page_key, lang, page_name):
                     if item_name:
                         item["name"] = item_name
                     if "url" in item:
-                        item["url"] = item["url"].replace(
-                            "https://reroutenj.org/",
-                            f"https://reroutenj.org/{lang}/"
-                        )
+                        item["url"] = localize_url(item["url"])
 
         elif schema_type == "Article":
             # Determine which article (blog_post, blog_post_embed, blog_post_cutover, or blog_post_bridge)
@@ -2040,69 +2192,107 @@ def translate_jsonld(html, translations, page_key, lang, page_name):
                 # Update mainEntityOfPage URL
                 mep = data.get("mainEntityOfPage", {})
                 if "@id" in mep:
-                    mep["@id"] = mep["@id"].replace(
-                        "https://reroutenj.org/",
-                        f"https://reroutenj.org/{lang}/"
-                    )
+                    mep["@id"] = localize_url(mep["@id"])
 
-        new_json = json.dumps(data, ensure_ascii=False, indent=4)
-        return prefix + new_json + "\n  " + suffix
+        if data == source:
+            # Nothing translated: skip the (pure-Python) indented encoder
+            new_json = formatted
+        else:
+            new_json = json.dumps(data, ensure_ascii=False, indent=4)
+        return prefix + new_json + "\n  " + JSONLD_CLOSE
 
-    return pattern.sub(replace_block, html)
+    page.replace_between(JSONLD_OPEN, JSONLD_CLOSE, replace_block)
 
 
 def generate_page(page_name, lang, translations):
     """Generate a single translated page."""
-    src_path = os.path.join(PROJECT_ROOT, page_name)
-    with open(src_path, "r", encoding="utf-8") as f:
-        html = f.read()
+    html = load_template(page_name)
 
-    page_key = PAGE_KEY_MAP.get(page_name, page_name.replace(".html", ""))
+    page_key = page_key_for(page_name)
     direction = get_translation(translations, "meta.dir") or "ltr"
 
+    page = PageRewriter(html)
+
     # 1. Set language and direction
-    html = set_html_lang(html, lang, direction)
+    set_html_lang(page, lang, direction)
 
     # 2. Fix asset paths for subdirectory
-    html = fix_asset_paths(html, page_name)
+    fix_asset_paths(page, page_name)
 
     # 3. Replace common elements
-    html = replace_skip_link(html, translations)
-    html = replace_nav_links(html, translations)
-    html = replace_hamburger_label(html, translations, page_key)
-    html = replace_a11y_buttons(html, translations)
-    html = replace_footer(html, translations, page_key)
-    html = replace_tagline(html, translations, page_key)
-    html = replace_title(html, translations, page_key)
-    html = replace_meta(html, translations, page_key)
-    html = replace_meta_description(html, translations, page_key)
-    html = fix_og_url(html, lang, page_name)
-    html = add_canonical(html, lang, page_name)
+    replace_chrome(page, translations)
+    replace_nav_links(page, translations)
+    replace_hamburger_label(page, translations, page_key)
+    replace_footer(page, translations, page_key)
+    replace_tagline(page, translations, page_key)
+    replace_title(page, translations, page_key)
+    replace_meta(page, translations, page_key)
+    replace_meta_description(page, translations, page_key)
+    fix_og_url(page, lang, page_name)
+    add_canonical(page, lang, page_name)
     # 4. Replace page-specific content
-    html = replace_page_specific_content(html, translations, page_key)
+    replace_page_specific_content(page, translations, page_key)
 
     # 4.5. Translate JSON-LD structured data
-    html = translate_jsonld(html, translations, page_key, lang, page_name)
+    translate_jsonld(page, translations, page_key, lang, page_name)
 
     # 5. Inject translations for JS runtime
-    html = inject_translations_script(html, translations, page_name)
+    inject_translations_script(page, translations, page_name)
 
     # 6. Add hreflang tags
-    html = add_hreflang_tags(html, page_name)
+    add_hreflang_tags(page, page_name)
+
+    # Every step above only queued edits against the template; apply them now
+    html = page.render()
+    if DEBUG_EDITS:
+        for start, end, new in page.dropped:
+            print(f"  {lang}/{page_name}: dropped overlapping edit "
+                  f"{page.text[start:end]!r} -> {new!r}", file=sys.stderr)
 
     # 7. Write output
+    # (output directories are created up front by make_output_dirs)
     out_path = os.path.join(PROJECT_ROOT, lang, page_name)
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(html)
+    with open(out_path, "wb") as f:
+        f.write(html.encode("utf-8"))
 
     return out_path
 
 
+def make_output_dirs(lang):
+    """Create /{lang}/ and its subdirectories (e.g. blog/) for every page."""
+    for subdir in sorted({os.path.dirname(page) for page in PAGES}):
+        os.makedirs(os.path.join(PROJECT_ROOT, lang, subdir), exist_ok=True)
+
+
+def is_up_to_date(page_name, lang):
+    """True if {lang}/{page_name} is newer than every input that shapes it.
+
+    Inputs are the English template, translations/{lang}.json and this
+    script itself, so editing the generator rebuilds everything.
+    """
+    try:
+        out_mtime = os.stat(os.path.join(PROJECT_ROOT, lang, page_name)).st_mtime
+    except OSError:
+        return False
+    inputs = (
+        os.path.join(PROJECT_ROOT, page_name),
+        os.path.join(TRANSLATIONS_DIR, f"{lang}.json"),
+        os.path.abspath(__file__),
+    )
+    return all(os.stat(path).st_mtime <= out_mtime for path in inputs)
+
+
 def main():
+    global DEBUG_EDITS
+    args = sys.argv[1:]
+    # --changed skips pages whose output is newer than all of their inputs
+    changed_only = "--changed" in args
+    DEBUG_EDITS = "--debug" in args
+    args = [arg for arg in args if arg not in ("--changed", "--debug")]
+
     # Determine which languages to generate
-    if len(sys.argv) > 1:
-        langs = sys.argv[1:]
+    if args:
+        langs = args
     else:
         # Find all translation files except English
         langs = []
@@ -2114,23 +2304,42 @@ def main():
         print("No translation files found. Create translations/*.json first.")
         sys.exit(1)
 
+    # set_html_lang() relies on every template opening with the English tag
+    for page in PAGES:
+        if HTML_LANG_TAG not in load_template(page):
+            print(f"Error: {page} has no {HTML_LANG_TAG}> tag to localize.")
+            sys.exit(1)
+
     total = 0
+    skipped = 0
     for lang in langs:
         trans_path = os.path.join(TRANSLATIONS_DIR, f"{lang}.json")
         if not os.path.exists(trans_path):
             print(f"  Warning: {trans_path} not found, skipping {lang}")
             continue
 
+        pending = [
+            page for page in PAGES
+            if not (changed_only and is_up_to_date(page, lang))
+        ]
+        skipped += len(PAGES) - len(pending)
+        if not pending:
+            continue
+        make_output_dirs(lang)
+
         translations = load_translations(lang)
         label = get_translation(translations, "meta.nativeName") or lang
         print(f"Generating {label} ({lang})...")
 
-        for page in PAGES:
+        for page in pending:
             out_path = generate_page(page, lang, translations)
             print(f"  {out_path}")
             total += 1
 
-    print(f"\nDone. Generated {total} pages.")
+    if skipped:
+        print(f"\nDone. Generated {total} pages ({skipped} up to date).")
+    else:
+        print(f"\nDone. Generated {total} pages.")
 
 
 if __name__ == "__main__":